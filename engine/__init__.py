@@ -0,0 +1,6 @@
+"""
+7x7 Stratejik Tahta Oyunu - oyun motoru.
+
+Pygame'e bağımlı olmayan kurallar, durum gösterimi ve arama kodu bu pakette
+bulunur. Arayüz (game.py) bu modülleri içe aktararak kullanır.
+"""
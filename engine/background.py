@@ -0,0 +1,133 @@
+"""
+Arka planda yapay zeka araması.
+
+Arama ayrı bir iş parçacığında çalışır; çağıran taraf (örneğin Pygame
+döngüsü) sonucu bloklanmadan yoklar. Arama "şimdi oyna" ile erken
+bitirilebilir ya da tamamen iptal edilebilir.
+
+Rakip düşünürken arama rakibin beklenen turundan sonraki konumu
+önceden arar (ponder). Rakip beklenen turu oynarsa arama kaldığı yerden
+normal aramaya döner ve sonuç hemen (ya da kalan süre sonunda) hazırdır;
+başka bir tur oynarsa arama iptal edilir. Her iki durumda da aramanın
+transpozisyon tablosuna yazdıkları sonraki aramalarda kullanılır.
+"""
+
+import threading
+import time
+
+from engine.board import apply_turn
+from engine.search import MAX_DEPTH
+
+PREDICTION_DEPTH = 1  # Beklenen tur tabloda yoksa rakip için yapılan aramanın derinliği
+
+
+class BackgroundSearch:
+    """Bir Searcher'ın iterative_deepening aramasını arka planda yürütür."""
+
+    def __init__(self, searcher):
+        self.searcher = searcher
+        self._thread = None
+        self._result = None
+        self._cancelled = False
+        self.pondering = False
+        self.ponder_state = None
+        self._ponder_start = None
+        self._stop_at = None
+
+    @property
+    def running(self):
+        """Başlatılmış ve sonucu henüz alınmamış bir arama varsa True."""
+        return self._thread is not None
+
+    def _launch(self, target, args):
+        if self._thread is not None:
+            self.cancel()
+        self.searcher.clear_stop()
+        self._result = None
+        self._cancelled = False
+        self._stop_at = None
+        self._thread = threading.Thread(target=target, args=args, daemon=True)
+        self._thread.start()
+
+    def start(self, state, time_limit, max_depth=None, turns_left=None):
+        """state için aramayı başlatır; önceki arama varsa önce iptal edilir."""
+        kwargs = {"time_limit": time_limit, "turns_left": turns_left}
+        if max_depth is not None:
+            kwargs["max_depth"] = max_depth
+        self._launch(self._run, (state, kwargs))
+
+    def _run(self, state, kwargs):
+        self._result = self.searcher.iterative_deepening(state, **kwargs)
+
+    def ponder(self, state, turns_left=None):
+        """Rakip (Player 2) state konumunda düşünürken beklenen turundan sonrasını arar.
+
+        Beklenen tur önceki aramanın transpozisyon tablosundan okunur, yoksa
+        rakip için sığ bir aramayla bulunur. Arama süre sınırı olmadan
+        ponder_hit() ya da cancel() çağrılana kadar sürer.
+        """
+        self._launch(self._run_ponder, (state, turns_left))
+        self.pondering = True
+        self._ponder_start = time.monotonic()
+
+    def _run_ponder(self, state, turns_left):
+        searcher = self.searcher
+        turn = searcher.table_turn(state, turns_left, 2)
+        if turn is None:
+            turn = searcher.iterative_deepening(state, None, PREDICTION_DEPTH, turns_left, 2)
+        if turn is None or searcher.stop_requested():
+            return
+        self.ponder_state = apply_turn(state, turn, 2)
+        self._result = searcher.iterative_deepening(self.ponder_state, None, MAX_DEPTH, turns_left, 1)
+
+    def ponder_hit(self, state, time_limit):
+        """Rakibin turu bitince çağrılır; state beklenen konumsa True döndürür.
+
+        Tahmin tuttuysa arama sürer ve ponder() çağrısından time_limit
+        sonra (bu süre geçtiyse hemen) son tamamlanan derinliğin turuyla
+        biter; sonuç done() ve result() ile alınır. Tutmadıysa arama iptal
+        edilir ve False döner.
+        """
+        if not self.pondering:
+            return False
+        self.pondering = False
+        if state != self.ponder_state:
+            self.cancel()
+            return False
+        self._stop_at = self._ponder_start + time_limit
+        return True
+
+    def done(self):
+        """Arama bittiyse True döndürür (bloklamaz).
+
+        Tahmini tutan ponder aramasının süresi dolduysa önce aramayı durdurur.
+        """
+        if self._stop_at is not None and time.monotonic() >= self._stop_at:
+            self._stop_at = None
+            self.move_now()
+        return self._thread is not None and not self._thread.is_alive()
+
+    def result(self):
+        """Biten aramanın turunu döndürür ve aramayı kapatır.
+
+        Arama bitmemişse bitmesini bekler.
+        """
+        self._thread.join()
+        self._thread = None
+        return None if self._cancelled else self._result
+
+    def move_now(self):
+        """Aramayı son tamamlanan derinlikteki turla hemen bitirir."""
+        if self._thread is not None:
+            self.searcher.stop()
+
+    def cancel(self):
+        """Aramayı durdurur ve sonucunu atar."""
+        self.pondering = False
+        self.ponder_state = None
+        self._stop_at = None
+        if self._thread is not None:
+            self._cancelled = True
+            self.searcher.stop()
+            self._thread.join()
+            self._thread = None
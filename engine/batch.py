@@ -0,0 +1,168 @@
+"""
+NumPy ile toplu konum değerlendirmesi.
+
+Çok sayıda konum (arama yaprakları, kendi kendine oyun analizi, katsayı
+ayarı veri kümeleri) tek seferde değerlendirilir; sonuçlar tek konumluk
+rules.evaluate_state ve bitboard.evaluate ile birebir aynıdır.
+
+İki giriş biçimi vardır:
+- (N, 7, 7) doluluk düzlemleri: planes[n, y, x] 0 (boş), 1 (Player 1) ya da
+  2 (Player 2)
+- p1, p2 bitboard dizileri (uint64, kare numarası y * 7 + x)
+
+Düzlemler önce bitboard dizilerine paketlenir; terimler bitboard.evaluate
+ile aynı kaydırma ve bit sayma işlemleriyle bütün dizi üzerinde hesaplanır.
+
+Bu modül NumPy gerektirir; oyunun geri kalanı NumPy olmadan çalışır.
+Hız ölçümü için: python -m engine.batch
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from engine import bitboard
+from engine.bitboard import GRID_SIZE, NUM_SQUARES
+
+_FULL = np.uint64(bitboard.FULL)
+_NOT_LAST_COLUMN = np.uint64(bitboard.NOT_LAST_COLUMN)
+_ONE = np.uint64(1)
+_ROW = np.uint64(GRID_SIZE)
+_CENTER_RINGS = [(bonus, np.uint64(mask)) for bonus, mask in bitboard.CENTER_RINGS]
+
+if hasattr(np, "bitwise_count"):
+    def _popcount(bits):
+        return np.bitwise_count(bits).astype(np.int64)
+else:
+    # NumPy 2.0 öncesi: bayt başına bit sayısı tablosu
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+    def _popcount(bits):
+        return _BYTE_COUNTS[bits.view(np.uint8).reshape(-1, 8)].sum(axis=1)
+
+
+def states_to_bitboards(states):
+    """BitState dizisini (p1, p2) uint64 dizilerine çevirir."""
+    states = list(states)
+    p1 = np.fromiter((state.p1 for state in states), dtype=np.uint64, count=len(states))
+    p2 = np.fromiter((state.p2 for state in states), dtype=np.uint64, count=len(states))
+    return p1, p2
+
+
+def planes_to_bitboards(planes):
+    """(N, 7, 7) doluluk düzlemlerini (p1, p2) uint64 dizilerine çevirir."""
+    planes = np.asarray(planes)
+    if planes.ndim != 3 or planes.shape[1:] != (GRID_SIZE, GRID_SIZE):
+        raise ValueError(f"Düzlemler (N, {GRID_SIZE}, {GRID_SIZE}) boyutunda olmalı: {planes.shape}")
+    cells = planes.reshape(len(planes), NUM_SQUARES)
+    result = []
+    for player in (1, 2):
+        # 49 bit 7 bayta paketlenir, 8. bayt sıfırla doldurulup uint64 olarak okunur
+        packed = np.packbits(cells == player, axis=1, bitorder="little")
+        padded = np.zeros((len(planes), 8), dtype=np.uint8)
+        padded[:, :packed.shape[1]] = packed
+        result.append(padded.view("<u8").ravel().astype(np.uint64))
+    return tuple(result)
+
+
+def bitboards_to_planes(p1, p2):
+    """(p1, p2) uint64 dizilerini (N, 7, 7) doluluk düzlemlerine çevirir."""
+    planes = np.zeros((len(p1), NUM_SQUARES), dtype=np.int8)
+    for player, bits in ((1, p1), (2, p2)):
+        raw = np.ascontiguousarray(bits, dtype="<u8").view(np.uint8).reshape(-1, 8)
+        cells = np.unpackbits(raw, axis=1, bitorder="little")[:, :NUM_SQUARES]
+        planes[cells.astype(bool)] = player
+    return planes.reshape(-1, GRID_SIZE, GRID_SIZE)
+
+
+def _side_features(bits):
+    material = _popcount(bits)
+    center = sum(bonus * _popcount(bits & mask) for bonus, mask in _CENTER_RINGS)
+    east = (bits & _NOT_LAST_COLUMN) << _ONE
+    south = (bits << _ROW) & _FULL
+    # Her komşu çift iki taşa da birer puan kazandırır
+    protection = 2 * (_popcount(bits & east) + _popcount(bits & south))
+    return material, center, protection
+
+
+def features(p1, p2):
+    """Değerlendirme terimlerinin farklarını (N, 3) dizisi olarak döndürür.
+
+    Sütunlar bitboard.Weights sırasındadır (taş, merkez, koruma). Saldırı
+    bonusu iki taraf için aynı olduğundan farkta birbirini götürür.
+    """
+    p1 = np.asarray(p1, dtype=np.uint64)
+    p2 = np.asarray(p2, dtype=np.uint64)
+    return np.stack(
+        [own - other for own, other in zip(_side_features(p1), _side_features(p2))],
+        axis=1,
+    )
+
+
+def evaluate(p1, p2, weights=bitboard.DEFAULT_WEIGHTS):
+    """Bitboard dizilerindeki konumların puanlarını döndürür.
+
+    DEFAULT_WEIGHTS ile her eleman bitboard.evaluate() ile aynıdır; diğer
+    katsayılarla bitboard.evaluate_weighted() ile aynıdır.
+    """
+    p1 = np.asarray(p1, dtype=np.uint64)
+    p2 = np.asarray(p2, dtype=np.uint64)
+    score = 0
+    for weight, own, other in zip(weights, _side_features(p1), _side_features(p2)):
+        if weight:
+            score = score + weight * (own - other)
+    if np.isscalar(score):
+        return np.zeros(len(p1), dtype=np.int64)
+    return score
+
+
+def evaluate_planes(planes, weights=bitboard.DEFAULT_WEIGHTS):
+    """(N, 7, 7) doluluk düzlemlerindeki konumların puanlarını döndürür."""
+    return evaluate(*planes_to_bitboards(planes), weights)
+
+
+def evaluate_states(states, weights=bitboard.DEFAULT_WEIGHTS):
+    """BitState dizisindeki konumların puanlarını döndürür."""
+    return evaluate(*states_to_bitboards(states), weights)
+
+
+def random_bitboards(count, pieces=4, seed=0):
+    """Her iki tarafın da en çok pieces taşı olduğu rastgele konumlar üretir."""
+    rng = np.random.default_rng(seed)
+    # Her konum için karelerin rastgele bir sırası: ilk taşlar P1'e, sonrakiler P2'ye
+    order = np.argsort(rng.random((count, NUM_SQUARES)), axis=1)
+    counts = rng.integers(1, pieces + 1, size=(2, count))
+    bits = np.left_shift(_ONE, order[:, :2 * pieces].astype(np.uint64))
+    index = np.arange(pieces)
+    p1 = np.where(index < counts[0][:, None], bits[:, :pieces], 0).astype(np.uint64)
+    p2 = np.where(index < counts[1][:, None], bits[:, pieces:], 0).astype(np.uint64)
+    return np.bitwise_or.reduce(p1, axis=1), np.bitwise_or.reduce(p2, axis=1)
+
+
+def main(argv=None):
+    """Toplu değerlendirmenin hızını ölçer ve tek konumluk sonuçla karşılaştırır."""
+    parser = argparse.ArgumentParser(description="NumPy toplu değerlendirme hızı")
+    parser.add_argument("--count", type=int, default=1_000_000, help="konum sayısı")
+    parser.add_argument("--check", type=int, default=10_000, help="karşılaştırılacak konum sayısı")
+    args = parser.parse_args(argv)
+
+    p1, p2 = random_bitboards(args.count)
+    planes = bitboards_to_planes(p1, p2)
+    for name, function, inputs in (("bitboard", evaluate, (p1, p2)), ("düzlem", evaluate_planes, (planes,))):
+        start = time.perf_counter()
+        scores = function(*inputs)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>8}: {args.count} konum {elapsed:.3f} s ({args.count / elapsed / 1e6:.1f} milyon/s)")
+
+    sample = random.Random(0).sample(range(args.count), min(args.check, args.count))
+    mismatches = sum(
+        1 for i in sample
+        if scores[i] != bitboard.evaluate(bitboard.BitState(int(p1[i]), int(p2[i])))
+    )
+    print(f"tek konumluk evaluate() ile farklı: {mismatches} / {len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Sabit konumlarla arama ve kural fonksiyonlarının hız ölçümü.
+
+Açılış, orta oyun ve oyun sonundan seçilmiş konumlarda (PLAYER_1/PLAYER_2
+başlangıcı dahil) sıcak yollar ölçülür: liste tabanlı kurallar
+(get_possible_moves, make_move, apply_captures, evaluate_state), bitboard
+karşılıkları, tur üretimi ve birkaç derinlikte alpha-beta araması. Sonuçlar
+JSON olarak yazılır ve kaydedilmiş bir temel ölçümle karşılaştırılabilir.
+
+Kullanım:
+    python -m engine.benchmark --output baseline.json
+    python -m engine.benchmark --baseline baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from engine import bitboard, rules
+from engine.board import SearchBoard
+from engine.search import Searcher
+
+# Konum adı: (Player 1 konumları, Player 2 konumları); sıra her zaman Player 1'de
+POSITIONS = {
+    "opening/start": (rules.PLAYER_1["positions"], rules.PLAYER_2["positions"]),
+    "opening/early": ([(0, 2), (0, 3), (6, 4), (6, 5)], [(5, 0), (5, 2), (1, 5), (0, 6)]),
+    "midgame/center": ([(3, 3), (3, 4), (6, 4), (6, 5)], [(3, 1), (3, 2), (1, 3), (1, 4)]),
+    "midgame/contact": ([(3, 3), (4, 3), (3, 4), (4, 4)], [(1, 2), (2, 2), (1, 3), (2, 3)]),
+    "endgame/3v2": ([(1, 1), (3, 3), (5, 5)], [(2, 4), (4, 2)]),
+    "endgame/2v2": ([(0, 3), (4, 4)], [(3, 0), (6, 6)]),
+    "endgame/1v2": ([(3, 3)], [(1, 1), (5, 5)]),
+}
+DEFAULT_DEPTHS = (1, 2, 3)
+MIN_TIME = 0.2  # Mikro ölçümlerde bir tekrarın en kısa süresi (saniye)
+REPEAT = 3
+
+
+def _copy_positions(positions):
+    return [tuple(pos) for pos in positions]
+
+
+def time_call(function, min_time=MIN_TIME, repeat=REPEAT):
+    """function() çağrısının en iyi ortalama süresini (saniye) döndürür.
+
+    Her tekrarda çağrı sayısı süre en az min_time olana kadar ikiye katlanır.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def _rules_benchmarks(p1_positions, p2_positions):
+    state = {"player_1": _copy_positions(p1_positions), "player_2": _copy_positions(p2_positions)}
+    moves = rules.get_possible_moves(state, rules.PLAYER_1)
+
+    def make_moves():
+        for move in moves:
+            rules.make_move(state, move, rules.PLAYER_1)
+
+    def apply_captures():
+        # Yeme listeleri değiştirdiği için her hamle kopyalar üzerinde denetlenir
+        for move in moves:
+            after = rules.make_move(state, move, rules.PLAYER_1)
+            rules.apply_captures(move[1], {"positions": after["player_1"]}, {"positions": after["player_2"]})
+
+    return {
+        "rules.get_possible_moves": lambda: rules.get_possible_moves(state, rules.PLAYER_1),
+        "rules.make_move": make_moves,
+        "rules.apply_captures": apply_captures,
+        "rules.evaluate_state": lambda: rules.evaluate_state(state),
+    }, len(moves)
+
+
+def _bitboard_benchmarks(state):
+    moves = bitboard.generate_moves(state, 1)
+    board = SearchBoard(state, 1)
+
+    def make_moves():
+        for move in moves:
+            bitboard.make_move(state, move, 1)
+
+    def push_pop():
+        for move in moves:
+            board.push(move)
+            board.pop()
+
+    return {
+        "bitboard.generate_moves": lambda: bitboard.generate_moves(state, 1),
+        "bitboard.make_move": make_moves,
+        "bitboard.evaluate": lambda: bitboard.evaluate(state),
+        "board.push_pop": push_pop,
+        "board.turns": lambda: sum(1 for _ in board.turns()),
+    }
+
+
+def run(positions=None, depths=DEFAULT_DEPTHS, min_time=MIN_TIME):
+    """Ölçümleri çalıştırır ve JSON'a yazılabilir bir sözlük döndürür.
+
+    results anahtarları "ölçüm@konum" biçimindedir; değerler en az
+    "seconds" içerir (make_move ve apply_captures için konumdaki tüm
+    hamlelerin toplamı). Arama ölçümleri ayrıca düğüm sayısını verir.
+    """
+    if positions is None:
+        positions = POSITIONS
+    results = {}
+    for name, (p1_positions, p2_positions) in positions.items():
+        state = bitboard.from_positions(p1_positions, p2_positions)
+        micro, move_count = _rules_benchmarks(p1_positions, p2_positions)
+        micro.update(_bitboard_benchmarks(state))
+        for bench, function in micro.items():
+            results[f"{bench}@{name}"] = {"seconds": time_call(function, min_time), "moves": move_count}
+
+        for depth in depths:
+            best = None
+            for _ in range(REPEAT):
+                searcher = Searcher()
+                searcher.tt.new_search()
+                searcher.orderer.new_search()
+                start = time.perf_counter()
+                _, value, _ = searcher.search_root(state, depth)
+                elapsed = time.perf_counter() - start
+                if best is None or elapsed < best:
+                    best = elapsed
+            results[f"search.d{depth}@{name}"] = {
+                "seconds": best,
+                "nodes": searcher.nodes,
+                "nps": searcher.nodes / best if best else 0.0,
+                "value": value,
+            }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "depths": list(depths),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=0.10):
+    """İki run() sonucunu karşılaştırır.
+
+    (anahtar, temel_süre, yeni_süre, oran, durum) listesi döndürür; durum
+    oran 1 + threshold'dan büyükse "yavaş", 1 - threshold'dan küçükse
+    "hızlı", aksi halde "". Arama düğüm sayısı değişmişse durum "düğüm".
+    """
+    rows = []
+    for key, result in current["results"].items():
+        old = baseline.get("results", {}).get(key)
+        if old is None:
+            continue
+        ratio = result["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+        if "nodes" in result and result["nodes"] != old.get("nodes"):
+            status = "düğüm"
+        elif ratio > 1 + threshold:
+            status = "yavaş"
+        elif ratio < 1 - threshold:
+            status = "hızlı"
+        else:
+            status = ""
+        rows.append((key, old["seconds"], result["seconds"], ratio, status))
+    return rows
+
+
+def _format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} µs"
+
+
+def main(argv=None):
+    """Ölçümleri çalıştırır, yazdırır ve isteğe göre kaydeder/karşılaştırır."""
+    parser = argparse.ArgumentParser(description="Arama ve kural fonksiyonlarının hız ölçümü")
+    parser.add_argument("--depths", type=int, nargs="+", default=list(DEFAULT_DEPTHS), help="arama derinlikleri (tur)")
+    parser.add_argument("--positions", nargs="+", choices=sorted(POSITIONS), help="yalnızca bu konumlar")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help="mikro ölçüm tekrar süresi (saniye)")
+    parser.add_argument("--output", help="sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", help="karşılaştırılacak JSON dosyası")
+    parser.add_argument("--threshold", type=float, default=0.10, help="yavaşlama/hızlanma eşiği (oran)")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="yavaşlama ya da düğüm farkı varsa 1 koduyla çık")
+    args = parser.parse_args(argv)
+
+    positions = POSITIONS
+    if args.positions:
+        positions = {name: POSITIONS[name] for name in args.positions}
+    current = run(positions, args.depths, args.min_time)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+
+    if not args.baseline:
+        for key, result in current["results"].items():
+            extra = f"  {result['nodes']} düğüm  {result['nps']:.0f} düğüm/s" if "nodes" in result else ""
+            print(f"{key:<40} {_format_seconds(result['seconds']):>12}{extra}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(current, baseline, args.threshold)
+    print(f"{'ölçüm':<40} {'temel':>12} {'yeni':>12} {'oran':>6}")
+    for key, old, new, ratio, status in rows:
+        print(f"{key:<40} {_format_seconds(old):>12} {_format_seconds(new):>12} {ratio:>6.2f} {status}")
+    regressions = sum(1 for row in rows if row[4] in ("yavaş", "düğüm"))
+    print(f"{len(rows)} ölçüm, {regressions} yavaşlama/düğüm farkı")
+    if args.fail_on_regression and regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,429 @@
+"""
+Bitboard tabanlı oyun durumu.
+
+Her oyuncunun taşları 49 bitlik bir tamsayıda tutulur. (x, y) karesi
+``y * GRID_SIZE + x`` numaralı bite karşılık gelir. Hamle üretme, hamle
+uygulama, taş yeme ve değerlendirme bit işlemleriyle yapılır; sonuçlar
+engine.rules içindeki liste tabanlı fonksiyonlarla birebir aynıdır.
+"""
+
+from collections import namedtuple
+from itertools import product
+
+GRID_SIZE = 7
+NUM_SQUARES = GRID_SIZE * GRID_SIZE
+FULL = (1 << NUM_SQUARES) - 1
+
+try:
+    popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def popcount(bits):
+        return bin(bits).count("1")
+
+# Oyun durumu: p1 ve p2 ilgili oyuncunun taş bitleridir
+BitState = namedtuple("BitState", ["p1", "p2"])
+
+# Değerlendirme terimlerinin katsayıları (bkz. evaluate_weighted)
+Weights = namedtuple("Weights", ["material", "center", "protection"])
+DEFAULT_WEIGHTS = Weights(1, 1, 1)
+
+
+def square(x, y):
+    """(x, y) koordinatının kare numarasını döndürür."""
+    return y * GRID_SIZE + x
+
+
+def coords(sq):
+    """Kare numarasının (x, y) koordinatını döndürür."""
+    return (sq % GRID_SIZE, sq // GRID_SIZE)
+
+
+def _line_mask(cells):
+    mask = 0
+    for x, y in cells:
+        mask |= 1 << square(x, y)
+    return mask
+
+
+# Satır ve sütun maskeleri
+COLUMNS = [_line_mask((x, y) for y in range(GRID_SIZE)) for x in range(GRID_SIZE)]
+ROWS = [_line_mask((x, y) for x in range(GRID_SIZE)) for y in range(GRID_SIZE)]
+FIRST_COLUMN, LAST_COLUMN = COLUMNS[0], COLUMNS[-1]
+FIRST_ROW, LAST_ROW = ROWS[0], ROWS[-1]
+NOT_FIRST_COLUMN = FULL & ~FIRST_COLUMN
+NOT_LAST_COLUMN = FULL & ~LAST_COLUMN
+
+
+def shift_east(bits):
+    """Taşları bir kare sağa (x + 1) kaydırır."""
+    return (bits & NOT_LAST_COLUMN) << 1
+
+
+def shift_west(bits):
+    """Taşları bir kare sola (x - 1) kaydırır."""
+    return (bits & NOT_FIRST_COLUMN) >> 1
+
+
+def shift_south(bits):
+    """Taşları bir kare aşağı (y + 1) kaydırır."""
+    return (bits << GRID_SIZE) & FULL
+
+
+def shift_north(bits):
+    """Taşları bir kare yukarı (y - 1) kaydırır."""
+    return bits >> GRID_SIZE
+
+
+# Her kare için komşu kareler; sıra rules.get_possible_moves'taki yön sırası ile
+# aynıdır (aşağı, yukarı, sağ, sol)
+DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+STEPS = []
+for _sq in range(NUM_SQUARES):
+    _x, _y = coords(_sq)
+    STEPS.append(tuple(
+        (square(_x + dx, _y + dy), 1 << square(_x + dx, _y + dy))
+        for dx, dy in DIRECTIONS
+        if 0 <= _x + dx < GRID_SIZE and 0 <= _y + dy < GRID_SIZE
+    ))
+NEIGHBORS = [sum(bit for _, bit in steps) for steps in STEPS]
+
+# Merkeze uzaklığa göre kare bonusları: (bonus, maske) çiftleri
+CENTER = (GRID_SIZE // 2, GRID_SIZE // 2)
+CENTER_BONUS = [
+    GRID_SIZE - (abs(coords(sq)[0] - CENTER[0]) + abs(coords(sq)[1] - CENTER[1]))
+    for sq in range(NUM_SQUARES)
+]
+CENTER_RINGS = [
+    (bonus, sum(1 << sq for sq in range(NUM_SQUARES) if CENTER_BONUS[sq] == bonus))
+    for bonus in sorted(set(CENTER_BONUS))
+]
+
+
+def from_positions(player_1_positions, player_2_positions):
+    """PLAYER_1/PLAYER_2 konum listelerinden bitboard durumu oluşturur."""
+    p1 = 0
+    for x, y in player_1_positions:
+        p1 |= 1 << square(x, y)
+    p2 = 0
+    for x, y in player_2_positions:
+        p2 |= 1 << square(x, y)
+    return BitState(p1, p2)
+
+
+def squares_of(bits):
+    """Bitleri açık olan kare numaralarını küçükten büyüğe döndürür."""
+    result = []
+    while bits:
+        low = bits & -bits
+        result.append(low.bit_length() - 1)
+        bits ^= low
+    return result
+
+
+def positions_of(bits):
+    """Bitleri (x, y) konum listesine çevirir."""
+    return [coords(sq) for sq in squares_of(bits)]
+
+
+def to_positions(state):
+    """Bitboard durumunu (player_1, player_2) konum listelerine çevirir."""
+    return positions_of(state.p1), positions_of(state.p2)
+
+
+def move_to_coords(move):
+    """(kaynak, hedef) kare hamlesini ((x, y), (x, y)) biçimine çevirir."""
+    return coords(move[0]), coords(move[1])
+
+
+def move_from_coords(move):
+    """((x, y), (x, y)) hamlesini (kaynak, hedef) kare biçimine çevirir."""
+    (x0, y0), (x1, y1) = move
+    return square(x0, y0), square(x1, y1)
+
+
+def generate_moves(state, player, exclude=0):
+    """Oyuncunun (1 veya 2) bu durumdaki geçerli hamlelerini döndürür.
+
+    exclude bitlerindeki taşlar hamle üretmez (turun ikinci hamlesinde ilk
+    hamleyi yapan taş).
+    """
+    own = (state.p1 if player == 1 else state.p2) & ~exclude
+    occupied = state.p1 | state.p2
+    moves = []
+    while own:
+        low = own & -own
+        own ^= low
+        sq = low.bit_length() - 1
+        for to, bit in STEPS[sq]:
+            if not occupied & bit:
+                moves.append((sq, to))
+    return moves
+
+
+def apply_move(state, move, player):
+    """Hamleyi uygular (taş yeme olmadan) ve yeni durumu döndürür."""
+    flip = (1 << move[0]) | (1 << move[1])
+    if player == 1:
+        return BitState(state.p1 ^ flip, state.p2)
+    return BitState(state.p1, state.p2 ^ flip)
+
+
+def _sandwiched_horizontal(victim, capturer):
+    """Yatayda iki rakip taş arasında kalan taş dizilerini bulur."""
+    from_west = victim & shift_east(capturer)
+    from_east = victim & shift_west(capturer)
+    for _ in range(GRID_SIZE - 3):
+        from_west |= victim & shift_east(from_west)
+        from_east |= victim & shift_west(from_east)
+    return from_west & from_east
+
+
+def _sandwiched_vertical(victim, capturer):
+    """Dikeyde iki rakip taş arasında kalan taş dizilerini bulur."""
+    from_north = victim & shift_south(capturer)
+    from_south = victim & shift_north(capturer)
+    for _ in range(GRID_SIZE - 3):
+        from_north |= victim & shift_south(from_north)
+        from_south |= victim & shift_north(from_south)
+    return from_north & from_south
+
+
+def _side_wall_captures(victim, capturer):
+    """Sol ve sağ duvara sıkışan taşları bulur.
+
+    Sol duvarda bir ya da iki taş, sağ duvarda yalnızca tek taş yenir.
+    """
+    single = FIRST_COLUMN & victim & shift_west(capturer)
+    double = FIRST_COLUMN & victim & shift_west(victim) & shift_west(shift_west(capturer))
+    single |= LAST_COLUMN & victim & shift_east(capturer)
+    return single | double | shift_east(double)
+
+
+def _top_bottom_wall_captures(victim, capturer):
+    """Üst ve alt duvara sıkışan bir ya da iki taşı bulur."""
+    single = FIRST_ROW & victim & shift_north(capturer)
+    single |= LAST_ROW & victim & shift_south(capturer)
+    top = FIRST_ROW & victim & shift_north(victim) & shift_north(shift_north(capturer))
+    bottom = LAST_ROW & victim & shift_south(victim) & shift_south(shift_south(capturer))
+    return single | top | shift_south(top) | bottom | shift_north(bottom)
+
+
+def resolve_captures(state):
+    """Tüm tahtada taş yeme kurallarını uygular ve yeni durumu döndürür.
+
+    Sıra: yatay sandviç (önce P2, sonra P1), dikey sandviç (önce P2, sonra
+    P1), sol/sağ duvar, üst/alt duvar. Hamle sonrasında capture_at aynı
+    sonucu yalnızca hedef karenin çizgilerine bakarak verir.
+    """
+    p1, p2 = state
+    p2 &= ~_sandwiched_horizontal(p2, p1)
+    p1 &= ~_sandwiched_horizontal(p1, p2)
+    p2 &= ~_sandwiched_vertical(p2, p1)
+    p1 &= ~_sandwiched_vertical(p1, p2)
+    p1, p2 = p1 & ~_side_wall_captures(p1, p2), p2 & ~_side_wall_captures(p2, p1)
+    p1, p2 = p1 & ~_top_bottom_wall_captures(p1, p2), p2 & ~_top_bottom_wall_captures(p2, p1)
+    return BitState(p1, p2)
+
+
+# Hamle sonrası taş yeme tabloları.
+#
+# Hamleden önce tahtada bekleyen bir yeme yoksa (oyunda ulaşılan her konum
+# böyledir) hamlenin yol açtığı her yeme hedef kareyi içerir; dolayısıyla
+# yalnızca hedef karenin satırı ve sütunu değişebilir. Her 7 karelik çizgi
+# deseni için sonuç önceden hesaplanır. Tablo indeksi
+# p1_çizgisi | p2_çizgisi << 7, değeri yenen_p1 | yenen_p2 << 7 biçimindedir.
+
+LINE_MASK = (1 << GRID_SIZE) - 1
+_ROW_TO_COLUMN_SHIFT = NUM_SQUARES - GRID_SIZE
+# Sütundaki bitleri (0, 7, ..., 42) çarpma ile üst 7 bite toplar
+_COLUMN_MAGIC = sum(1 << ((GRID_SIZE - 1) * (GRID_SIZE - k)) for k in range(GRID_SIZE))
+# 7 bitlik çizgiyi ilk sütunun bitlerine yayar
+COLUMN_SPREAD = [
+    sum(1 << (GRID_SIZE * k) for k in range(GRID_SIZE) if line >> k & 1)
+    for line in range(1 << GRID_SIZE)
+]
+
+
+def _column_line(bits, x):
+    """x sütunundaki bitleri 7 bitlik çizgi olarak döndürür (bit k = y)."""
+    return (((bits >> x) & FIRST_COLUMN) * _COLUMN_MAGIC >> _ROW_TO_COLUMN_SHIFT) & LINE_MASK
+
+
+def _line_table(capture):
+    """capture(p1, p2) -> (yenen_p1, yenen_p2) fonksiyonundan çizgi tablosu kurar."""
+    table = [0] * (1 << (2 * GRID_SIZE))
+    for cells in product((0, 1, 2), repeat=GRID_SIZE):
+        line1 = sum(1 << k for k, cell in enumerate(cells) if cell == 1)
+        line2 = sum(1 << k for k, cell in enumerate(cells) if cell == 2)
+        removed1, removed2 = capture(line1, line2)
+        table[line1 | line2 << GRID_SIZE] = removed1 | removed2 << GRID_SIZE
+    return table
+
+
+def _line_sandwiches(line1, line2):
+    # Çizgi ilk satıra yerleştirilir; önce P2, sonra P1 yenir
+    removed2 = _sandwiched_horizontal(line2, line1)
+    removed1 = _sandwiched_horizontal(line1, line2 & ~removed2)
+    return removed1, removed2
+
+
+def _line_side_walls(line1, line2):
+    return _side_wall_captures(line1, line2), _side_wall_captures(line2, line1)
+
+
+def _line_top_bottom_walls(line1, line2):
+    # Çizgi ilk sütuna yerleştirilir (bit k = y)
+    column1, column2 = COLUMN_SPREAD[line1], COLUMN_SPREAD[line2]
+    return (
+        _column_line(_top_bottom_wall_captures(column1, column2), 0),
+        _column_line(_top_bottom_wall_captures(column2, column1), 0),
+    )
+
+
+LINE_SANDWICHES = _line_table(_line_sandwiches)
+LINE_SIDE_WALLS = _line_table(_line_side_walls)
+LINE_TOP_BOTTOM_WALLS = _line_table(_line_top_bottom_walls)
+
+
+def capture_at(p1, p2, sq):
+    """sq karesine yapılan hamleden sonra taş yeme kurallarını uygular.
+
+    resolve_captures ile aynı sırayı yalnızca sq'nun satırında ve sütununda
+    uygular; hamleden önceki konumda bekleyen yeme olmamalıdır. Yeni
+    (p1, p2) bitlerini döndürür.
+    """
+    x = sq % GRID_SIZE
+    shift = sq - x
+
+    # Satırdaki sandviçler
+    removed = LINE_SANDWICHES[(p1 >> shift) & LINE_MASK | ((p2 >> shift) & LINE_MASK) << GRID_SIZE]
+    if removed:
+        p1 &= ~((removed & LINE_MASK) << shift)
+        p2 &= ~((removed >> GRID_SIZE) << shift)
+
+    # Sütundaki sandviçler
+    removed = LINE_SANDWICHES[_column_line(p1, x) | _column_line(p2, x) << GRID_SIZE]
+    if removed:
+        p1 &= ~(COLUMN_SPREAD[removed & LINE_MASK] << x)
+        p2 &= ~(COLUMN_SPREAD[removed >> GRID_SIZE] << x)
+
+    # Sol/sağ duvar
+    removed = LINE_SIDE_WALLS[(p1 >> shift) & LINE_MASK | ((p2 >> shift) & LINE_MASK) << GRID_SIZE]
+    if removed:
+        p1 &= ~((removed & LINE_MASK) << shift)
+        p2 &= ~((removed >> GRID_SIZE) << shift)
+
+    # Üst/alt duvar
+    removed = LINE_TOP_BOTTOM_WALLS[_column_line(p1, x) | _column_line(p2, x) << GRID_SIZE]
+    if removed:
+        p1 &= ~(COLUMN_SPREAD[removed & LINE_MASK] << x)
+        p2 &= ~(COLUMN_SPREAD[removed >> GRID_SIZE] << x)
+
+    return p1, p2
+
+
+def make_move(state, move, player):
+    """Hamleyi uygular, ardından taş yeme kurallarını çalıştırır."""
+    p1, p2 = apply_move(state, move, player)
+    return BitState(*capture_at(p1, p2, move[1]))
+
+
+def is_terminal(state):
+    """Oyunculardan birinin taşı kalmamışsa True döndürür."""
+    return not state.p1 or not state.p2
+
+
+def winner(state):
+    """Bitmiş oyunun kazananı: taşı fazla olan oyuncu (1 veya 2), eşitse 0.
+
+    Taşı kalmayan oyuncu da tur sınırında taşı az olan oyuncu da kaybeder.
+    """
+    n1 = popcount(state.p1)
+    n2 = popcount(state.p2)
+    if n1 > n2:
+        return 1
+    if n2 > n1:
+        return 2
+    return 0
+
+
+def _center_bonus(bits):
+    return sum(bonus * popcount(bits & mask) for bonus, mask in CENTER_RINGS)
+
+
+def _protection_bonus(bits):
+    # Her komşu çift iki taşa da birer puan kazandırır
+    return 2 * (popcount(bits & shift_east(bits)) + popcount(bits & shift_south(bits)))
+
+
+def evaluate(state):
+    """rules.evaluate_state ile aynı puanı bit işlemleriyle hesaplar.
+
+    Saldırı bonusu her iki taraf için de aynı komşu P1-P2 çiftlerini sayar,
+    bu yüzden farkta birbirini götürür ve hesaplanmaz.
+    """
+    p1, p2 = state
+    return (
+        popcount(p1) - popcount(p2)
+        + _center_bonus(p1) - _center_bonus(p2)
+        + _protection_bonus(p1) - _protection_bonus(p2)
+    )
+
+
+def evaluate_weighted(state, weights):
+    """evaluate() terimlerini verilen katsayılarla (Weights) toplar.
+
+    DEFAULT_WEIGHTS ile sonuç evaluate() ile aynıdır.
+    """
+    p1 = state.p1
+    p2 = state.p2
+    return (
+        weights.material * (popcount(p1) - popcount(p2))
+        + weights.center * (_center_bonus(p1) - _center_bonus(p2))
+        + weights.protection * (_protection_bonus(p1) - _protection_bonus(p2))
+    )
+
+
+# Artımlı değerlendirme: evaluate() puanı hamle başına yalnızca değişen
+# terimler güncellenerek taşınır.
+
+def piece_score(sq, own):
+    """sq karesindeki taşın kendi tarafına kattığı puan.
+
+    own, aynı taraftaki diğer taşlardır (sq hariç): taş sayısı (1), merkez
+    bonusu ve komşu dost taşlarla paylaşılan koruma bonusu (çift başına 2).
+    """
+    return 1 + CENTER_BONUS[sq] + 2 * popcount(NEIGHBORS[sq] & own)
+
+
+def move_delta(state, move, player):
+    """Hamlenin (taş yeme olmadan) evaluate() puanına etkisi."""
+    from_sq, to_sq = move
+    own = (state.p1 if player == 1 else state.p2) & ~(1 << from_sq)
+    delta = piece_score(to_sq, own) - piece_score(from_sq, own)
+    return delta if player == 1 else -delta
+
+
+def removal_delta(removed, own):
+    """own taraftaki removed taşlarının kaldırılmasının taraf puanına etkisi."""
+    delta = 0
+    while removed:
+        low = removed & -removed
+        removed ^= low
+        own ^= low
+        delta -= piece_score(low.bit_length() - 1, own)
+    return delta
+
+
+def make_move_scored(state, score, move, player):
+    """make_move ile aynı, ayrıca yeni evaluate() puanını artımlı hesaplar.
+
+    (yeni_durum, yeni_puan) döndürür.
+    """
+    score += move_delta(state, move, player)
+    moved = apply_move(state, move, player)
+    after = BitState(*capture_at(moved.p1, moved.p2, move[1]))
+    if after != moved:
+        score += removal_delta(moved.p1 & ~after.p1, moved.p1)
+        score -= removal_delta(moved.p2 & ~after.p2, moved.p2)
+    return after, score
@@ -0,0 +1,349 @@
+"""
+Arama için değiştirilebilir tahta.
+
+SearchBoard hamleleri yerinde uygular (push) ve geri alır (pop). Taş yeme,
+değerlendirme puanı ve Zobrist hash her hamlede artımlı güncellenir; geri
+alma için gereken değerler önceden ayrılmış yığınlarda tutulur, böylece
+arama düğüm başına yeni durum nesnesi oluşturmaz.
+
+Tahta konumun dikey aynasının hash'ini de (mirror_key) artımlı tutar;
+transpozisyon tablosu iki anahtardan küçüğünü kullanarak ayna konumları
+tek kayıtta birleştirir (bkz. engine.symmetry).
+
+Oyunda iki veya daha fazla taşı olan oyuncu bir turda iki farklı taşını
+oynatır. turns() bu bileşik turları üretir; aynı konuma varan turlar (ör.
+birbirinden bağımsız iki hamlenin iki sırası) yalnızca bir kez verilir.
+"""
+
+from engine import bitboard
+from engine.bitboard import NUM_SQUARES, BitState, piece_score, popcount
+from engine.symmetry import flip_square, flip_state
+from engine.transposition import (
+    ZOBRIST_P1,
+    ZOBRIST_P2,
+    ZOBRIST_P2_TO_MOVE,
+    ZOBRIST_TURNS,
+    zobrist_hash,
+)
+
+MAX_PLY = 128
+
+# Aynadaki karşılık gelen karenin Zobrist değerleri
+MIRROR_P1 = [ZOBRIST_P1[flip_square(sq)] for sq in range(NUM_SQUARES)]
+MIRROR_P2 = [ZOBRIST_P2[flip_square(sq)] for sq in range(NUM_SQUARES)]
+
+
+def _xor_keys(bits, table):
+    key = 0
+    while bits:
+        low = bits & -bits
+        bits ^= low
+        key ^= table[low.bit_length() - 1]
+    return key
+
+
+def _promote(moves, move):
+    # Hamle listedeyse başa alınmış yeni bir liste döndürür
+    if move in moves:
+        moves = [m for m in moves if m != move]
+        moves.insert(0, move)
+    return moves
+
+
+class SearchBoard:
+    """Yerinde hamle uygulayıp geri alan arama tahtası.
+
+    p1, p2: taş bitleri; player: sıradaki oyuncu (1 veya 2); score:
+    bitboard.evaluate() değeri; key: transposition.zobrist_hash() değeri;
+    mirror_key: dikey aynanın zobrist_hash() değeri.
+    turns_left: Player 1'in kalan tur sayısı (None ise tur sınırı yok).
+    """
+
+    __slots__ = ("p1", "p2", "player", "turns_left", "score", "key", "mirror_key", "ply",
+                 "_p1", "_p2", "_player", "_turns_left", "_score", "_key", "_mirror_key")
+
+    def __init__(self, state, player=1, turns_left=None, max_ply=MAX_PLY):
+        self.p1, self.p2 = state
+        self.player = player
+        self.turns_left = turns_left
+        self.score = bitboard.evaluate(state)
+        self.key = zobrist_hash(state, player, turns_left)
+        self.mirror_key = zobrist_hash(flip_state(self), player, turns_left)
+        self.ply = 0
+        self._p1 = [0] * max_ply
+        self._p2 = [0] * max_ply
+        self._player = [0] * max_ply
+        self._turns_left = [None] * max_ply
+        self._score = [0] * max_ply
+        self._key = [0] * max_ply
+        self._mirror_key = [0] * max_ply
+
+    def state(self):
+        """Mevcut konumu BitState olarak döndürür."""
+        return BitState(self.p1, self.p2)
+
+    def is_terminal(self):
+        """Oyunculardan birinin taşı kalmamışsa True döndürür."""
+        return not self.p1 or not self.p2
+
+    def is_game_over(self):
+        """Taşı kalmayan oyuncu varsa ya da tur sınırı dolduysa True döndürür.
+
+        Oyun, Player 1 son turunu oynadığında (sıra Player 2'ye geçerken) biter.
+        """
+        return not self.p1 or not self.p2 or (self.player == 2 and self.turns_left == 0)
+
+    def generate_moves(self, exclude=0):
+        """Sıradaki oyuncunun geçerli hamlelerini döndürür."""
+        return bitboard.generate_moves(self, self.player, exclude)
+
+    def _save(self):
+        ply = self.ply
+        self._p1[ply] = self.p1
+        self._p2[ply] = self.p2
+        self._player[ply] = self.player
+        self._turns_left[ply] = self.turns_left
+        self._score[ply] = self.score
+        self._key[ply] = self.key
+        self._mirror_key[ply] = self.mirror_key
+        self.ply = ply + 1
+
+    def _end_turn(self):
+        # Sıra rakibe geçer; Player 1'in turu bittiyse kalan tur azalır
+        delta = ZOBRIST_P2_TO_MOVE
+        if self.player == 1:
+            turns_left = self.turns_left
+            if turns_left is not None:
+                delta ^= ZOBRIST_TURNS[turns_left] ^ ZOBRIST_TURNS[turns_left - 1]
+                self.turns_left = turns_left - 1
+            self.player = 2
+        else:
+            self.player = 1
+        self.key ^= delta
+        self.mirror_key ^= delta
+
+    def push(self, move, end_turn=True):
+        """Sıradaki oyuncunun hamlesini taş yemeyle birlikte uygular.
+
+        end_turn False ise sıra aynı oyuncuda kalır (turun ilk hamlesi).
+        """
+        p1 = self.p1
+        p2 = self.p2
+        score = self.score
+        key = self.key
+        mirror_key = self.mirror_key
+        self._save()
+
+        from_sq, to_sq = move
+        from_bit = 1 << from_sq
+        flip = from_bit | (1 << to_sq)
+        if self.player == 1:
+            own = p1 & ~from_bit
+            score += piece_score(to_sq, own) - piece_score(from_sq, own)
+            key ^= ZOBRIST_P1[from_sq] ^ ZOBRIST_P1[to_sq]
+            mirror_key ^= MIRROR_P1[from_sq] ^ MIRROR_P1[to_sq]
+            p1 ^= flip
+        else:
+            own = p2 & ~from_bit
+            score -= piece_score(to_sq, own) - piece_score(from_sq, own)
+            key ^= ZOBRIST_P2[from_sq] ^ ZOBRIST_P2[to_sq]
+            mirror_key ^= MIRROR_P2[from_sq] ^ MIRROR_P2[to_sq]
+            p2 ^= flip
+
+        after_p1, after_p2 = bitboard.capture_at(p1, p2, to_sq)
+        if after_p1 != p1:
+            removed = p1 & ~after_p1
+            score += bitboard.removal_delta(removed, p1)
+            key ^= _xor_keys(removed, ZOBRIST_P1)
+            mirror_key ^= _xor_keys(removed, MIRROR_P1)
+        if after_p2 != p2:
+            removed = p2 & ~after_p2
+            score -= bitboard.removal_delta(removed, p2)
+            key ^= _xor_keys(removed, ZOBRIST_P2)
+            mirror_key ^= _xor_keys(removed, MIRROR_P2)
+
+        self.p1 = after_p1
+        self.p2 = after_p2
+        self.score = score
+        self.key = key
+        self.mirror_key = mirror_key
+        if end_turn:
+            self._end_turn()
+
+    def push_pass(self):
+        """Hamle yapmadan turu bitirir (hamle kalmadığında)."""
+        self._save()
+        self._end_turn()
+
+    def pop(self):
+        """Son push() ya da push_pass() çağrısını geri alır."""
+        ply = self.ply = self.ply - 1
+        self.p1 = self._p1[ply]
+        self.p2 = self._p2[ply]
+        self.player = self._player[ply]
+        self.turns_left = self._turns_left[ply]
+        self.score = self._score[ply]
+        self.key = self._key[ply]
+        self.mirror_key = self._mirror_key[ply]
+
+    def push_turn(self, turn):
+        """turns() ile üretilmiş bir turu (hamle demeti) uygular."""
+        if not turn:
+            self.push_pass()
+            return
+        for move in turn[:-1]:
+            self.push(move, end_turn=False)
+        self.push(turn[-1])
+
+    def pop_turn(self, turn):
+        """push_turn(turn) çağrısını geri alır."""
+        for _ in range(len(turn) or 1):
+            self.pop()
+
+    def turns(self, order=None, first=None):
+        """Sıradaki oyuncunun birbirinden farklı sonuçlanan turlarını üretir.
+
+        Her tur hamle demetidir: iki taşlı oyuncu için (hamle, hamle), tek
+        taşlı oyuncu ya da ikinci hamlesi kalmayan oyuncu için (hamle,),
+        hiç hamlesi yoksa (). Tur verildiğinde tahtaya uygulanmıştır ve
+        üreteç devam ettirilince geri alınır; döngüden erken çıkılırsa
+        tahtanın eski haline dönmesi için üreteç close() ile kapatılmalıdır.
+
+        order verilirse hamle listelerini sıralamak için çağrılır; first
+        verilirse bu turun hamleleri önce denenir.
+        """
+        moves = self.generate_moves()
+        if not moves:
+            self.push_pass()
+            try:
+                yield ()
+            finally:
+                self.pop()
+            return
+        if order is not None:
+            moves = order(moves)
+        if first:
+            moves = _promote(moves, first[0])
+
+        own = self.p1 if self.player == 1 else self.p2
+        if popcount(own) < 2:
+            for move in moves:
+                self.push(move)
+                try:
+                    yield (move,)
+                finally:
+                    self.pop()
+            return
+
+        seen = set()
+        for move in moves:
+            self.push(move, end_turn=False)
+            try:
+                # İkinci hamleyi ilk hamleyi yapan taş dışındaki taşlar yapar
+                if self.is_terminal():
+                    second = ()
+                else:
+                    second = self.generate_moves(1 << move[1])
+                if not second:
+                    self.push_pass()
+                    try:
+                        if self.key not in seen:
+                            seen.add(self.key)
+                            yield (move,)
+                    finally:
+                        self.pop()
+                    continue
+                if order is not None:
+                    second = order(second)
+                if first and len(first) > 1 and first[0] == move:
+                    second = _promote(second, first[1])
+                for second_move in second:
+                    self.push(second_move)
+                    try:
+                        if self.key in seen:
+                            continue
+                        seen.add(self.key)
+                        yield (move, second_move)
+                    finally:
+                        self.pop()
+            finally:
+                self.pop()
+
+    def capture_moves(self, exclude=0):
+        """Sıradaki oyuncunun taş yiyen (herhangi bir rengin taşını kaldıran) hamleleri."""
+        moves = []
+        player = self.player
+        for move in self.generate_moves(exclude):
+            p1, p2 = bitboard.apply_move(self, move, player)
+            if bitboard.capture_at(p1, p2, move[1]) != (p1, p2):
+                moves.append(move)
+        return moves
+
+    def _best_quiet_move(self, moves):
+        """moves arasından sıradaki oyuncunun statik değerlendirmesini en iyi yapan hamle."""
+        sign = 1 if self.player == 1 else -1
+        best, best_score = None, None
+        for move in moves:
+            self.push(move)
+            score = sign * self.score
+            self.pop()
+            if best is None or score > best_score:
+                best, best_score = move, score
+        return best
+
+    def capture_turns(self):
+        """Sessizleşme araması için yalnızca taş yiyen turları üretir.
+
+        Turun ilk hamlesi taş yemelidir. İki taşlı oyuncunun ikinci hamlesi
+        ya başka bir yeme hamlesidir ya da (yeme yoksa) statik olarak en iyi
+        sessiz hamledir; ikinci hamle hiç yoksa tur turns()'teki gibi tek
+        hamleyle biter. Turlar turns() gibi tahtaya uygulanmış olarak
+        verilir; döngüden erken çıkılırsa üreteç close() ile kapatılmalıdır.
+        """
+        own = self.p1 if self.player == 1 else self.p2
+        single = popcount(own) < 2
+        seen = set()
+        for move in self.capture_moves():
+            self.push(move, end_turn=single)
+            try:
+                if single:
+                    yield (move,)
+                    continue
+                if self.is_terminal():
+                    second = ()
+                else:
+                    second = self.capture_moves(1 << move[1])
+                    if not second:
+                        quiet = self._best_quiet_move(self.generate_moves(1 << move[1]))
+                        second = () if quiet is None else (quiet,)
+                if not second:
+                    self.push_pass()
+                    try:
+                        if self.key not in seen:
+                            seen.add(self.key)
+                            yield (move,)
+                    finally:
+                        self.pop()
+                    continue
+                for second_move in second:
+                    self.push(second_move)
+                    try:
+                        if self.key in seen:
+                            continue
+                        seen.add(self.key)
+                        yield (move, second_move)
+                    finally:
+                        self.pop()
+            finally:
+                self.pop()
+
+def generate_turns(state, player=1):
+    """Oyuncunun bu durumdaki farklı turlarını liste olarak döndürür."""
+    return list(SearchBoard(state, player).turns())
+
+
+def apply_turn(state, turn, player):
+    """Turun hamlelerini sırayla (taş yemeyle) uygular ve yeni durumu döndürür."""
+    for move in turn:
+        state = bitboard.make_move(state, move, player)
+    return state
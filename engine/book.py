@@ -0,0 +1,214 @@
+"""
+Derin çevrimdışı aramayla hazırlanmış açılış kitabı.
+
+Başlangıç dizilimi sabit olduğundan ilk turlar her oyunda aynı aramayı
+tekrarlar. build_book() açılış ağacını oyundakinden daha derin arar:
+Player 1'in her konumu için en iyi tur kaydedilir, Player 2'nin bütün
+(ya da en iyi N) cevapları bir sonraki kitap turuna açılır.
+
+Dosya biçimi (küçük endian):
+    başlık: sihirli sözcük (8 bayt), sürüm (uint32), kayıt sayısı (uint32),
+            başlangıç konumunun Zobrist hash'i (uint64, hash tablosu denetimi)
+    kayıtlar: hash'e göre sıralı 16 baytlık kayıtlar: hash (uint64), turun
+            en çok iki hamlesi (4 x uint8 kare; boş hamle 255), değer
+            (int16), arama derinliği (uint8), dolgu
+
+Anahtar konum ile dikey aynasının küçük hash'idir (engine.symmetry); tur
+anahtarın ait olduğu konuma göre yazılır ve okunurken geri aynalanır.
+
+Dosya mmap ile açılır ve ikili arama ile okunur; tamamı belleğe
+yüklenmez.
+
+Oluşturmak için: python -m engine.book --output assets/opening_book.bin
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from collections import namedtuple
+
+from engine import bitboard
+from engine.board import apply_turn, generate_turns
+from engine.rules import MAX_TURNS, PLAYER_1, PLAYER_2
+from engine.search import Searcher
+from engine.symmetry import canonical_key, flip_turn
+
+MAGIC = b"TAHTABK\x00"
+VERSION = 2
+HEADER = struct.Struct("<8sIIQ")
+RECORD = struct.Struct("<Q4BhBx")
+NO_SQUARE = 255
+
+DEFAULT_DEPTH = 6
+DEFAULT_PLIES = 2
+
+# turn: hamle demeti; score: Player 1 açısından arama değeri; depth: tamamlanan derinlik
+BookEntry = namedtuple("BookEntry", ["turn", "score", "depth"])
+
+INITIAL_STATE = bitboard.from_positions(PLAYER_1["positions"], PLAYER_2["positions"])
+
+
+def book_key(state, player=1):
+    """Konumun kitap anahtarı (kalan tur sayısı katılmamış kanonik Zobrist hash)."""
+    return canonical_key(state, player)[0]
+
+
+def write_book(path, entries):
+    """{anahtar: BookEntry} sözlüğünü kitap dosyasına yazar."""
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(entries), book_key(INITIAL_STATE)))
+        for key in sorted(entries):
+            turn, score, depth = entries[key]
+            squares = [sq for move in turn for sq in move]
+            squares += [NO_SQUARE] * (4 - len(squares))
+            score = max(-32768, min(32767, int(score)))
+            f.write(RECORD.pack(key, *squares, score, depth))
+
+
+def key_at(mm, offset, record_size, index):
+    """offset'ten başlayan sabit boyutlu kayıtlardan index'incinin uint64 anahtarı."""
+    return struct.unpack_from("<Q", mm, offset + index * record_size)[0]
+
+
+def lower_bound(mm, offset, record_size, count, key):
+    """Anahtara göre sıralı kayıtlarda anahtarı key'den küçük olmayan ilk kaydın sırası.
+
+    Kayıtlar offset'ten başlar ve uint64 anahtarla başlar; böyle bir kayıt
+    yoksa count döner.
+    """
+    lo, hi = 0, count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key_at(mm, offset, record_size, mid) < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class OpeningBook:
+    """mmap ile açılmış salt okunur kitap dosyası."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, check = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Geçersiz kitap dosyası: {path}")
+        if check != book_key(INITIAL_STATE):
+            self.close()
+            raise ValueError(f"Kitap farklı bir hash tablosuyla oluşturulmuş: {path}")
+        if HEADER.size + count * RECORD.size > len(self._mm):
+            self.close()
+            raise ValueError(f"Kitap dosyası eksik: {path}")
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def probe(self, state, player=1):
+        """Konumun kaydını BookEntry olarak döndürür, yoksa None."""
+        key, flipped = canonical_key(state, player)
+        lo = lower_bound(self._mm, HEADER.size, RECORD.size, self.count, key)
+        if lo == self.count or key_at(self._mm, HEADER.size, RECORD.size, lo) != key:
+            return None
+        _, a, b, c, d, score, depth = RECORD.unpack_from(self._mm, HEADER.size + lo * RECORD.size)
+        turn = tuple(move for move in ((a, b), (c, d)) if move[0] != NO_SQUARE)
+        if flipped:
+            turn = flip_turn(turn)
+        return BookEntry(turn, score, depth)
+
+    def lookup(self, state, player=1):
+        """Konum kitapta varsa ve tur bu konumda geçerliyse turu döndürür, yoksa None.
+
+        Tur, generate_turns() turlarından aynı konuma varanla karşılaştırılır:
+        aynalanmış bir konumda üretilen tur aynı hamlelerin ters sırası
+        olabilir. Dönen tur generate_turns() listesindeki turdur.
+        """
+        entry = self.probe(state, player)
+        if entry is None:
+            return None
+        results = {apply_turn(state, turn, player): turn for turn in generate_turns(state, player)}
+        return results.get(apply_turn(state, entry.turn, player))
+
+    def close(self):
+        """Dosya eşlemesini kapatır."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def build_book(plies=DEFAULT_PLIES, depth=DEFAULT_DEPTH, replies=None, time_limit=None, progress=None):
+    """Başlangıç konumundan açılış kitabını hesaplar; {anahtar: BookEntry} döndürür.
+
+    plies: kitapta yer alan Player 1 turu sayısı; depth: konum başına arama
+    derinliği (tur); replies: her konumda açılacak en iyi Player 2 cevabı
+    sayısı (None ise hepsi). progress verilirse her konumdan sonra
+    (konum_sayısı, BookEntry) ile çağrılır.
+    """
+    searcher = Searcher()
+    entries = {}
+    frontier = [INITIAL_STATE]
+    for ply in range(plies):
+        next_frontier = []
+        seen = set()
+        for state in frontier:
+            key, flipped = canonical_key(state)
+            if key in entries or not bitboard.generate_moves(state, 1):
+                continue
+            turn = searcher.iterative_deepening(state, time_limit, depth, MAX_TURNS - ply)
+            stored = flip_turn(turn) if flipped else turn
+            entries[key] = BookEntry(stored, searcher.best_value, searcher.completed_depth)
+            if progress is not None:
+                progress(len(entries), entries[key])
+            if ply + 1 == plies:
+                continue
+
+            after = apply_turn(state, turn, 1)
+            if bitboard.is_terminal(after):
+                continue
+            answers = generate_turns(after, 2)
+            if replies is not None:
+                # Cevaplar sığ bir aramayla sıralanır; Player 2 en küçük değeri tercih eder
+                _, _, scores = searcher.search_root(after, 1, answers, MAX_TURNS - ply - 1, player=2)
+                answers = sorted(answers, key=lambda answer: scores[answer])[:replies]
+            for answer in answers:
+                child = apply_turn(after, answer, 2)
+                child_key = book_key(child)
+                if child_key not in seen and not bitboard.is_terminal(child):
+                    seen.add(child_key)
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return entries
+
+
+def main(argv=None):
+    """Açılış kitabını hesaplar ve dosyaya yazar."""
+    parser = argparse.ArgumentParser(description="Açılış kitabı oluşturucu")
+    parser.add_argument("--output", default="opening_book.bin", help="kitap dosyası")
+    parser.add_argument("--plies", type=int, default=DEFAULT_PLIES, help="kitaptaki Player 1 turu sayısı")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="konum başına arama derinliği (tur)")
+    parser.add_argument("--replies", type=int, default=None, help="konum başına açılacak Player 2 cevabı (varsayılan: hepsi)")
+    parser.add_argument("--time", type=float, default=None, help="konum başına süre sınırı (saniye)")
+    args = parser.parse_args(argv)
+
+    start = time.monotonic()
+
+    def progress(count, entry):
+        print(f"{count:>5} konum  {time.monotonic() - start:>7.1f} s  derinlik {entry.depth}  değer {entry.score}")
+
+    entries = build_book(args.plies, args.depth, args.replies, args.time, progress)
+    write_book(args.output, entries)
+    print(f"{len(entries)} konum {args.output} dosyasına yazıldı")
+
+
+if __name__ == "__main__":
+    main()
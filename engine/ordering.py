@@ -0,0 +1,120 @@
+"""
+Hamle sıralama sezgileri.
+
+Alpha-beta budaması iyi hamleler önce denendiğinde daha erken keser. Sıra:
+taş yiyen hamleler (sandviç ve duvar kuralları), her katman için katil
+hamleler, son olarak geçmiş (history) tablosu.
+
+Karşılaştırma için: python -m engine.ordering
+"""
+
+import argparse
+
+from engine import bitboard
+
+CAPTURE_SCORE = 1 << 30
+KILLER_SCORES = (1 << 29, 1 << 28)
+MAX_PLY = 64
+
+
+def count_captures(state, move, player):
+    """Hamlenin yediği rakip taş sayısını döndürür."""
+    if player == 1:
+        opponent = state.p2
+    else:
+        opponent = state.p1
+    # Hedef karenin yanında rakip taş yoksa yeme olamaz
+    if not bitboard.NEIGHBORS[move[1]] & opponent:
+        return 0
+    after = bitboard.make_move(state, move, player)
+    remaining = after.p2 if player == 1 else after.p1
+    return bitboard.popcount(opponent) - bitboard.popcount(remaining)
+
+
+class MoveOrderer:
+    """Yakalama, katil hamle ve geçmiş tablosu ile hamle sıralayıcı.
+
+    Her sezgi ayrı ayrı kapatılabilir; hepsi kapalıyken hamleler üretildiği
+    sırada kalır.
+    """
+
+    def __init__(self, captures=True, killers=True, history=True):
+        self.use_captures = captures
+        self.use_killers = killers
+        self.use_history = history
+        self.clear()
+
+    def clear(self):
+        """Katil hamleleri ve geçmiş tablosunu sıfırlar."""
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = {
+            1: [0] * (bitboard.NUM_SQUARES * bitboard.NUM_SQUARES),
+            2: [0] * (bitboard.NUM_SQUARES * bitboard.NUM_SQUARES),
+        }
+
+    def new_search(self):
+        """Yeni arama başında katilleri temizler, geçmiş puanlarını yarıya indirir."""
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        for table in self.history.values():
+            for i, value in enumerate(table):
+                if value:
+                    table[i] = value >> 1
+
+    def order(self, state, moves, player, ply):
+        """Hamleleri iyiden kötüye sıralanmış yeni bir liste olarak döndürür."""
+        if not (self.use_captures or self.use_killers or self.use_history):
+            return moves
+        killers = self.killers[ply] if self.use_killers and ply < MAX_PLY else (None, None)
+        history = self.history[player]
+        size = bitboard.NUM_SQUARES
+
+        def score(move):
+            value = 0
+            if self.use_captures:
+                captured = count_captures(state, move, player)
+                if captured:
+                    value += CAPTURE_SCORE + captured
+            if move == killers[0]:
+                value += KILLER_SCORES[0]
+            elif move == killers[1]:
+                value += KILLER_SCORES[1]
+            if self.use_history:
+                value += history[move[0] * size + move[1]]
+            return value
+
+        return sorted(moves, key=score, reverse=True)
+
+    def record_cutoff(self, move, player, ply, depth):
+        """Beta kesmesine yol açan hamleyi katil ve geçmiş tablolarına işler."""
+        if self.use_killers and ply < MAX_PLY:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        if self.use_history:
+            self.history[player][move[0] * bitboard.NUM_SQUARES + move[1]] += depth * depth
+
+
+def main(argv=None):
+    """Sabit derinlikte sıralamalı ve sıralamasız düğüm sayılarını yazdırır."""
+    from engine import rules
+    from engine.search import Searcher
+
+    parser = argparse.ArgumentParser(description="Hamle sıralamasının düğüm sayısına etkisi")
+    parser.add_argument("--depth", type=int, nargs="+", default=[1, 2, 3, 4])
+    args = parser.parse_args(argv)
+
+    state = bitboard.from_positions(rules.PLAYER_1["positions"], rules.PLAYER_2["positions"])
+    print(f"{'derinlik':>8} {'sırasız':>10} {'sıralı':>10} {'oran':>6}")
+    for depth in args.depth:
+        counts = []
+        for orderer in (MoveOrderer(False, False, False), MoveOrderer()):
+            searcher = Searcher(orderer=orderer)
+            searcher.tt.new_search()
+            searcher.search_root(state, depth)
+            counts.append(searcher.nodes)
+        print(f"{depth:>8} {counts[0]:>10} {counts[1]:>10} {counts[1] / counts[0]:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
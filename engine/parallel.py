@@ -0,0 +1,212 @@
+"""
+Kök hamlelerinin birden fazla işlemciye dağıtılarak aranması.
+
+Her kök turu bir işçi işlemde ayrı ayrı aranır. O ana kadar bulunan en iyi
+değer (alpha) işlemler arasında paylaşılır; yeni başlayan her tur bu sınırla
+aranır ve daha dar pencere sayesinde daha erken budanır.
+
+İşçilerin transpozisyon tabloları ayrıdır. Her kök turundan sonraki
+konumun tablo kaydı ana işleme döner ve ana tabloya yazılır; sonraki
+iterasyonda aynı tur hangi işçiye düşerse düşsün bu kayıtla (önceki
+iterasyonun en iyi cevabıyla) başlar. Rakibin beklenen turu da
+(Searcher.table_turn) bu kayıtlardan okunur.
+
+İşçiler "spawn" ile, havuz oluşturulurken başlatılır: iş parçacıkları ve
+Pygame/SDL durumu olan bir işlemin fork edilmesi güvenli değildir.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine.board import SearchBoard, generate_turns
+from engine.search import QUIESCENCE_NODES, Searcher, SearchTimeout
+from engine.tablebase import open_in_worker
+
+# İşçi işlem durumu (_init_worker ile kurulur)
+_shared_alpha = None
+_worker_searcher = None
+_worker_generation = None
+
+
+class _WorkerSearcher(Searcher):
+    """Durdurma isteğini ana işlemle paylaşılan bayraktan okuyan Searcher."""
+
+    def __init__(self, shared_stop, weights=None, tablebase=None, quiescence_nodes=QUIESCENCE_NODES):
+        super().__init__(weights=weights, tablebase=tablebase, quiescence_nodes=quiescence_nodes)
+        self.shared_stop = shared_stop
+
+    def stop_requested(self):
+        return self.shared_stop.value
+
+
+def _init_worker(shared_alpha, shared_stop, weights=None, tablebase_path=None,
+                 quiescence_nodes=QUIESCENCE_NODES):
+    global _shared_alpha, _worker_searcher
+    _shared_alpha = shared_alpha
+    _worker_searcher = _WorkerSearcher(shared_stop, weights, open_in_worker(tablebase_path), quiescence_nodes)
+
+
+def _ping():
+    return True
+
+
+def _search_root_turn(state, turn, depth, deadline, turns_left, player, generation, hint=None):
+    """Tek bir kök turunu arar: (tur, değer, kesin_mi, sayaçlar, kayıt) döndürür.
+
+    Paylaşılan alpha kök oyuncusunun açısındandır (Player 2 için değerin
+    negatifi). Değer bu sınırı geçmediyse yalnızca bir sınırdır (kesin
+    değildir). Süre dolarsa ya da durdurma istendiyse değer None olur; süre
+    iş başlamadan dolduysa arama hiç yapılmaz. Sayaçlar Searcher.counters()
+    biçimindedir.
+
+    hint ve dönen kayıt, turdan sonraki konumun (key, depth, score, flag,
+    best_move) transpozisyon tablosu kaydıdır; hint işçinin tablosunda daha
+    derin bir kayıt yoksa aramadan önce yazılır.
+
+    generation, ana aramanın tablo yaşıdır (tt.age). İşçi yeni bir yaş
+    gördüğünde seri iterative_deepening gibi tablosunu ve sıralayıcısını
+    yeni aramaya geçirir.
+    """
+    global _worker_generation
+    searcher = _worker_searcher
+    if generation != _worker_generation:
+        _worker_generation = generation
+        searcher.tt.new_search()
+        searcher.orderer.new_search()
+    searcher.reset_counters()
+    if searcher.stop_requested() or (deadline is not None and time.monotonic() >= deadline):
+        return turn, None, False, searcher.counters(), None
+    board = SearchBoard(state, player, turns_left)
+    board.push_turn(turn)
+    key = min(board.key, board.mirror_key)
+    if hint is not None:
+        entry = searcher.tt.probe(key)
+        if entry is None or entry[1] < hint[1]:
+            searcher.tt.store(*hint)
+    alpha = _shared_alpha.value
+    searcher.deadline = deadline
+    try:
+        if player == 1:
+            value = searcher._search(board, depth, alpha, float('inf'), 1)
+        else:
+            value = searcher._search(board, depth, float('-inf'), -alpha, 1)
+    except SearchTimeout:
+        return turn, None, False, searcher.counters(), None
+    finally:
+        searcher.deadline = None
+    own_value = value if player == 1 else -value
+    with _shared_alpha.get_lock():
+        if own_value > _shared_alpha.value:
+            _shared_alpha.value = own_value
+    entry = searcher.tt.probe(key)
+    return turn, value, own_value > alpha, searcher.counters(), entry[:5] if entry is not None else None
+
+
+class ParallelSearcher(Searcher):
+    """Kök aramasını bir işlem havuzuna dağıtan Searcher.
+
+    workers 1 ise havuz açılmaz ve arama Searcher ile aynı şekilde seri
+    yapılır. İşçiler oluşturucuda başlatılır; Pygame uygulamasında nesne
+    pygame.init() öncesinde oluşturulmalıdır. Havuz close() ile
+    kapatılmalıdır (ya da with bloğu kullanılır).
+    """
+
+    def __init__(self, workers=None, tt=None, orderer=None, weights=None, tablebase=None,
+                 quiescence_nodes=QUIESCENCE_NODES):
+        super().__init__(tt, orderer, weights, tablebase, quiescence_nodes)
+        self.workers = workers or multiprocessing.cpu_count()
+        self._pool = None
+        self._shared_alpha = None
+        self._shared_stop = None
+        if self.workers > 1:
+            context = multiprocessing.get_context("spawn")
+            self._shared_alpha = context.Value('d', float('-inf'))
+            self._shared_stop = context.Value('b', False, lock=False)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self._shared_alpha, self._shared_stop, self.weights,
+                          tablebase.path if tablebase is not None else None, quiescence_nodes),
+            )
+            # Havuz işçileri ilk işte açar; hepsi şimdi başlatılıp hazır olması beklenir
+            for future in [self._pool.submit(_ping) for _ in range(self.workers)]:
+                future.result()
+
+    def stop(self):
+        super().stop()
+        if self._shared_stop is not None:
+            self._shared_stop.value = True
+
+    def clear_stop(self):
+        super().clear_stop()
+        if self._shared_stop is not None:
+            self._shared_stop.value = False
+
+    def search_root(self, state, depth, turns=None, turns_left=None, player=1):
+        """Searcher.search_root ile aynı sonucu işçi işlemlerde hesaplar.
+
+        Derinlik 0 (yalnızca yaprak değerlendirmesi) işçilere dağıtılmaya
+        değmez ve bu işlemde seri aranır. Bir tur süre dolduğu için
+        sonuçsuz dönerse sırada bekleyen turlar iptal edilir.
+        """
+        if self._pool is None or depth == 0:
+            return super().search_root(state, depth, turns, turns_left, player)
+        if turns is None:
+            turns = generate_turns(state, player)
+
+        self._shared_alpha.value = float('-inf')
+        futures = [
+            self._pool.submit(_search_root_turn, state, turn, depth, self.deadline, turns_left, player,
+                              self.tt.age, self._child_entry(state, turn, turns_left, player))
+            for turn in turns
+        ]
+        results = {}
+        exact = set()
+        timed_out = False
+        for future in futures:
+            if timed_out and future.cancel():
+                continue
+            turn, value, is_exact, counters, entry = future.result()
+            self.add_counters(counters)
+            if value is None:
+                timed_out = True
+                continue
+            if entry is not None:
+                self.tt.store(*entry)
+            results[turn] = value
+            if is_exact:
+                exact.add(turn)
+        if timed_out:
+            raise SearchTimeout()
+
+        # En iyi tur kesin değerler arasından seçilir; eşitlikte seri
+        # aramadaki gibi önce gelen tur kazanır
+        sign = 1 if player == 1 else -1
+        best_turn = None
+        best_value = float('-inf')
+        for turn in turns:
+            if turn in exact and sign * results[turn] > best_value:
+                best_value = sign * results[turn]
+                best_turn = turn
+        return best_turn, sign * best_value, results
+
+    def _child_entry(self, state, turn, turns_left, player):
+        """Kök turundan sonraki konumun ana tablodaki kaydı (yoksa None)."""
+        board = SearchBoard(state, player, turns_left)
+        board.push_turn(turn)
+        entry = self.tt.probe(min(board.key, board.mirror_key))
+        return entry[:5] if entry is not None else None
+
+    def close(self):
+        """İşlem havuzunu kapatır."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,355 @@
+"""
+İkili oyun kayıtları, hızlı yeniden oynatma ve konum indeksi.
+
+Kayıt dosyası, oyun sürerken sonuna eklenen kayıtlardan oluşur; her kayıt
+yazıldığı anda diske gönderilir, yarıda kalan bir dosya da okunabilir.
+
+Dosya biçimi (küçük endian): sihirli sözcük (8 bayt) ve sürüm (uint32),
+ardından tür baytıyla başlayan kayıtlar:
+    START    (20 bayt) başlangıç bitleri p1, p2 (2 x uint64), ilk oynayan
+             oyuncu (uint8), tur sınırı (uint16)
+    MOVE     (12 bayt) oyuncu, kaynak kare, hedef kare (3 x uint8), yenen
+             taşların bitleri (uint64; iki rengin taşları birlikte)
+    TURN_END (2 bayt)  turu biten oyuncu (hamlesiz tur pas demektir)
+    END      (2 bayt)  kazanan (0 beraberlik)
+
+Yenen taşlar kayıtta olduğundan yeniden oynatma yeme kurallarını
+çalıştırmaz; konumlar bit işlemleriyle kurulur.
+
+Konum indeksi ayrı bir dosyadır: (Zobrist hash, oyun, ply) kayıtları hash'e
+göre sıralıdır ve mmap üzerinde ikili aramayla okunur. ply, oyunda o ana
+kadar tamamlanan tur (yarım tur) sayısıdır.
+
+Kullanım:
+    python -m engine.record info oyunlar.rec
+    python -m engine.record replay oyunlar.rec --game 0 --ply 10
+    python -m engine.record index oyunlar.rec --output oyunlar.idx
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+from engine import bitboard
+from engine.bitboard import GRID_SIZE, BitState
+from engine.book import key_at, lower_bound
+from engine.transposition import zobrist_hash
+
+MAGIC = b"TAHTAGR\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sI")
+
+START = 1
+MOVE = 2
+TURN_END = 3
+END = 4
+RECORDS = {
+    START: struct.Struct("<BQQBH"),
+    MOVE: struct.Struct("<BBBBQ"),
+    TURN_END: struct.Struct("<BB"),
+    END: struct.Struct("<BB"),
+}
+
+INDEX_MAGIC = b"TAHTAIX\x00"
+INDEX_HEADER = struct.Struct("<8sII")
+INDEX_RECORD = struct.Struct("<QII")
+
+# turns: her tur ((hamle, yenen_bitler), ...) demeti; winner: bitmemiş oyunda None
+GameRecord = namedtuple("GameRecord", ["state", "player", "max_turns", "turns", "winner"])
+
+
+def captured_bits(state, move, player, after):
+    """Hamlenin yediği taşların bitleri (after: yeme sonrası konum)."""
+    moved = bitboard.apply_move(state, move, player)
+    return (moved[0] | moved[1]) & ~(after.p1 | after.p2)
+
+
+class GameWriter:
+    """Kayıt dosyasının sonuna oyun ekleyen yazıcı.
+
+    Dosya yoksa başlığıyla oluşturulur. Her kayıt yazıldığı anda diske
+    gönderilir; program yarıda kesilse de o ana kadarki hamleler okunur.
+    Önceki bir yazıcı kayıt ortasında kesildiyse dosya son tam kayıttan
+    sonra kısaltılır; yeni kayıtlar yarım kaydın ardına yazılmaz.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not new:
+            with open(path, "rb") as f:
+                data = f.read()
+            _check_header(data, path)
+            end = HEADER.size
+            for end, _, _ in _records(data, path):
+                pass
+            if end < len(data):
+                with open(path, "r+b") as f:
+                    f.truncate(end)
+        self._file = open(path, "ab")
+        if new:
+            self._file.write(HEADER.pack(MAGIC, VERSION))
+            self._file.flush()
+
+    def _write(self, kind, *values):
+        self._file.write(RECORDS[kind].pack(kind, *values))
+        self._file.flush()
+
+    def start_game(self, state, player=1, max_turns=0):
+        """Yeni bir oyunu başlangıç konumuyla açar."""
+        self._write(START, state.p1, state.p2, player, max_turns)
+
+    def move(self, player, move, captured=0):
+        """Bir hamleyi (kaynak, hedef kare) ve yediği taşların bitlerini ekler."""
+        self._write(MOVE, player, move[0], move[1], captured)
+
+    def end_turn(self, player):
+        """player'ın turunu bitirir; hamlesiz tur pas olarak okunur."""
+        self._write(TURN_END, player)
+
+    def end_game(self, winner):
+        """Oyunu kazananla (0 beraberlik) kapatır."""
+        self._write(END, winner)
+
+    def write_game(self, state, turns, winner, player=1, max_turns=0):
+        """Turları (hamle demetleri) oynatıp yenen taşlarıyla bütün bir oyunu yazar."""
+        self.start_game(state, player, max_turns)
+        for turn in turns:
+            for move in turn:
+                after = bitboard.make_move(state, move, player)
+                self.move(player, move, captured_bits(state, move, player, after))
+                state = after
+            self.end_turn(player)
+            player = 3 - player
+        self.end_game(winner)
+
+    def close(self):
+        """Dosyayı kapatır."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _check_header(data, path):
+    if len(data) < HEADER.size:
+        raise ValueError(f"Oyun kaydı dosyası eksik: {path}")
+    magic, version = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Geçersiz oyun kaydı dosyası: {path}")
+
+
+def _records(data, path):
+    # Başlıktan sonraki tam kayıtları (bitiş baytı, tür, değerler) olarak
+    # üretir; sondaki yarım kayıt yok sayılır
+    offset = HEADER.size
+    while offset < len(data):
+        kind = data[offset]
+        record = RECORDS.get(kind)
+        if record is None:
+            raise ValueError(f"Bozuk oyun kaydı ({path}, bayt {offset})")
+        if offset + record.size > len(data):
+            return  # Yazılırken kesilmiş kayıt
+        values = record.unpack_from(data, offset)
+        offset += record.size
+        yield offset, kind, values
+
+
+def read_games(path):
+    """Kayıt dosyasındaki oyunları GameRecord olarak sırayla üretir.
+
+    Dosyanın sonundaki yarım kayıt ve bitmemiş tur yok sayılır; bitmemiş
+    oyunun winner alanı None olur. Boş dosyada oyun yoktur; başlıktan kısa
+    ya da başlığı geçersiz dosya ValueError verir.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data:
+        return
+    _check_header(data, path)
+
+    game = None
+    turn = []
+    for offset, kind, values in _records(data, path):
+        if kind == START:
+            if game is not None:
+                yield game
+            _, p1, p2, player, max_turns = values
+            game = GameRecord(BitState(p1, p2), player, max_turns, [], None)
+            turn = []
+        elif game is None:
+            raise ValueError(f"Oyun başlangıcı olmayan kayıt ({path}, bayt {offset})")
+        elif kind == MOVE:
+            _, _, from_sq, to_sq, captured = values
+            turn.append(((from_sq, to_sq), captured))
+        elif kind == TURN_END:
+            game.turns.append(tuple(turn))
+            turn = []
+        else:
+            yield game._replace(winner=values[1])
+            game = None
+    if game is not None:
+        yield game
+
+
+def positions(game):
+    """Oyunun konumlarını (ply, konum, sıradaki oyuncu) olarak üretir.
+
+    İlk konum ply 0'dır; her turdan sonra bir konum daha verilir. Yeme
+    kuralları çalıştırılmaz, kayıttaki yenen taşlar silinir.
+    """
+    p1, p2 = game.state
+    player = game.player
+    yield 0, BitState(p1, p2), player
+    for ply, turn in enumerate(game.turns, 1):
+        for (from_sq, to_sq), captured in turn:
+            flip = (1 << from_sq) | (1 << to_sq)
+            if player == 1:
+                p1 ^= flip
+            else:
+                p2 ^= flip
+            p1 &= ~captured
+            p2 &= ~captured
+        player = 3 - player
+        yield ply, BitState(p1, p2), player
+
+
+def replay(game, ply=None):
+    """Oyunun ply turdan sonraki konumunu (konum, sıradaki oyuncu) döndürür.
+
+    ply None ise oyunun son konumu döner.
+    """
+    if ply is not None and not 0 <= ply <= len(game.turns):
+        raise IndexError(f"Oyunda {len(game.turns)} tur var: {ply}")
+    for current, state, player in positions(game):
+        if current == ply:
+            break
+    return state, player
+
+
+def build_index(path, output):
+    """Kayıt dosyasındaki her konum için (hash, oyun, ply) indeksini yazar.
+
+    Yazılan kayıt sayısını döndürür.
+    """
+    entries = []
+    for game_index, game in enumerate(read_games(path)):
+        for ply, state, player in positions(game):
+            entries.append((zobrist_hash(state, player), game_index, ply))
+    entries.sort()
+    with open(output, "wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, VERSION, len(entries)))
+        for entry in entries:
+            f.write(INDEX_RECORD.pack(*entry))
+    return len(entries)
+
+
+class PositionIndex:
+    """mmap ile açılmış konum indeksi: hash'ten (oyun, ply) listesine."""
+
+    def __init__(self, path):
+        self._mm = None
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < INDEX_HEADER.size:
+                raise ValueError(f"Konum indeksi eksik: {path}")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = INDEX_HEADER.unpack_from(self._mm, 0)
+        if magic != INDEX_MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Geçersiz konum indeksi: {path}")
+        if INDEX_HEADER.size + count * INDEX_RECORD.size > len(self._mm):
+            self.close()
+            raise ValueError(f"Konum indeksi eksik: {path}")
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def find(self, state, player=1):
+        """Konumun geçtiği (oyun, ply) çiftlerini döndürür."""
+        key = zobrist_hash(state, player)
+        lo = lower_bound(self._mm, INDEX_HEADER.size, INDEX_RECORD.size, self.count, key)
+        found = []
+        while lo < self.count and key_at(self._mm, INDEX_HEADER.size, INDEX_RECORD.size, lo) == key:
+            _, game, ply = INDEX_RECORD.unpack_from(self._mm, INDEX_HEADER.size + lo * INDEX_RECORD.size)
+            found.append((game, ply))
+            lo += 1
+        return found
+
+    def close(self):
+        """Dosya eşlemesini kapatır."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def format_state(state):
+    """Konumu metin tahta olarak döndürür (X: Player 1, O: Player 2)."""
+    rows = []
+    for y in range(GRID_SIZE):
+        row = ""
+        for x in range(GRID_SIZE):
+            bit = 1 << bitboard.square(x, y)
+            row += "X" if state.p1 & bit else "O" if state.p2 & bit else "."
+        rows.append(row)
+    return "\n".join(rows)
+
+
+def main(argv=None):
+    """Kayıt dosyasını özetler, bir konumu gösterir ya da indeks oluşturur."""
+    parser = argparse.ArgumentParser(description="Oyun kayıtları")
+    commands = parser.add_subparsers(dest="command", required=True)
+    info = commands.add_parser("info", help="oyun ve tur sayılarını yazdır")
+    info.add_argument("path")
+    show = commands.add_parser("replay", help="bir oyunun konumunu göster")
+    show.add_argument("path")
+    show.add_argument("--game", type=int, default=0, help="oyun numarası (0'dan)")
+    show.add_argument("--ply", type=int, default=None, help="tamamlanan tur sayısı (varsayılan: son konum)")
+    index = commands.add_parser("index", help="konum indeksi oluştur")
+    index.add_argument("path")
+    index.add_argument("--output", required=True, help="indeks dosyası")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "info":
+            games = list(read_games(args.path))
+            results = [0, 0, 0]
+            for game in games:
+                if game.winner is not None:
+                    results[game.winner] += 1
+            turns = sum(len(game.turns) for game in games)
+            unfinished = sum(1 for game in games if game.winner is None)
+            print(f"{len(games)} oyun, {turns} tur  P1: {results[1]}  P2: {results[2]}  "
+                  f"beraberlik: {results[0]}  bitmemiş: {unfinished}")
+        elif args.command == "replay":
+            for number, game in enumerate(read_games(args.path)):
+                if number == args.game:
+                    break
+            else:
+                parser.error(f"oyun bulunamadı: {args.game}")
+            state, player = replay(game, args.ply)
+            print(format_state(state))
+            print(f"sıra: Player {player}")
+        else:
+            count = build_index(args.path, args.output)
+            print(f"{count} konum {args.output} dosyasına yazıldı")
+    except (OSError, ValueError, IndexError) as error:
+        # Eksik, kısa ya da bozuk dosya: iz yerine kısa bir hata mesajı
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
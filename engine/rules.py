@@ -0,0 +1,206 @@
+"""
+Oyun kuralları (Pygame bağımlılığı olmadan).
+
+Taş konumları, hamle geçerliliği, taş yeme kuralları ve durum değerlendirmesi
+bu modüldedir. Arayüz ve toplu çalışan işlemler (test, benchmark) aynı
+kuralları buradan içe aktarır.
+"""
+
+import random
+
+from engine import bitboard
+from engine.bitboard import GRID_SIZE
+
+# Hata ayıklama çıktıları varsayılan olarak kapalıdır (bkz. set_debug)
+DEBUG = False
+
+# Oyuncu taşları
+P1_SYMBOL = "triangle"
+P2_SYMBOL = "circle"
+PLAYER_1 = {"symbol": P1_SYMBOL, "positions": [(0, 0), (0, 2), (6, 4), (6, 6)]}
+PLAYER_2 = {"symbol": P2_SYMBOL, "positions": [(6, 0), (6, 2), (0, 4), (0, 6)]}
+
+# Oyun, Player 1 bu kadar tur oynadığında biter (bkz. bitboard.winner)
+MAX_TURNS = 50
+
+
+def set_debug(enabled):
+    """Hata ayıklama çıktılarını açar veya kapatır."""
+    global DEBUG
+    DEBUG = enabled
+
+
+def debug(message):
+    """DEBUG açıksa mesajı ekrana yazar."""
+    if DEBUG:
+        print(message)
+
+
+# Duvar pozisyonları
+TOP_WALL = [(x, 0) for x in range(GRID_SIZE)]
+BOTTOM_WALL = [(x, GRID_SIZE - 1) for x in range(GRID_SIZE)]
+LEFT_WALL = [(0, y) for y in range(GRID_SIZE)]
+RIGHT_WALL = [(GRID_SIZE - 1, y) for y in range(GRID_SIZE)]
+ALL_WALLS = set(TOP_WALL + BOTTOM_WALL + LEFT_WALL + RIGHT_WALL)
+
+
+# taşların koruma (savunma) ve saldırı (rakip taşları tehdit etme) durumlarını değerlendirme
+# Bu özellik, taşların hem korunmasını hem de stratejik hamleler için rakibin taşlarını hedef almasını sağlar.
+# Koruma, bir taşın kendi takım arkadaşları tarafından çevrili olma durumudur. Eğer bir taş, kendi takımından 
+# bir veya daha fazla taş tarafından destekleniyorsa, bu durum bir avantajdır
+# Saldırı, bir taşın rakip taşlara yakın olması durumudur. Eğer bir taş, rakip taşları tehdit edebilecek bir 
+# konumdaysa, bu durum stratejik bir avantajdır
+# Score=Player 1 Piece Count−Player 2 Piece Count+Center Bonus+Protection Bonus+Attack Bonus
+def evaluate_state(state):
+    """Durumu değerlendirir ve bir puan döndürür."""
+    center = (GRID_SIZE // 2, GRID_SIZE // 2)  # 7x7 için merkez (3, 3)
+
+    def calculate_center_bonus(positions):
+        """Taşların merkeze yakınlığına göre bonus puan hesaplar."""
+        bonus = 0
+        for pos in positions:
+            distance = abs(pos[0] - center[0]) + abs(pos[1] - center[1])
+            bonus += (GRID_SIZE - distance)  # Daha yakın taşlar daha fazla puan alır
+        return bonus
+
+    def calculate_protection_bonus(player_positions):
+        """Kendi takım arkadaşları tarafından korunan taşlar için bonus hesaplar."""
+        bonus = 0
+        for pos in player_positions:
+            x, y = pos
+            neighbors = [(x + dx, y + dy) for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]]
+            # Komşulardan birinin aynı oyuncunun taşına ait olması koruma sağlar
+            bonus += sum(1 for neighbor in neighbors if neighbor in player_positions)
+        return bonus
+
+    def calculate_attack_bonus(player_positions, opponent_positions):
+        """Rakip taşlara yakın olan taşlar için bonus hesaplar."""
+        bonus = 0
+        for pos in player_positions:
+            x, y = pos
+            neighbors = [(x + dx, y + dy) for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]]
+            # Komşulardan biri rakibin taşına aitse saldırı avantajı sağlanır
+            bonus += sum(1 for neighbor in neighbors if neighbor in opponent_positions)
+        return bonus
+
+    # Player 1 değerlendirmesi
+    player_1_positions = state["player_1"]
+    player_1_center_bonus = calculate_center_bonus(player_1_positions)
+    player_1_protection_bonus = calculate_protection_bonus(player_1_positions)
+    player_1_attack_bonus = calculate_attack_bonus(player_1_positions, state["player_2"])
+
+    # Player 2 değerlendirmesi
+    player_2_positions = state["player_2"]
+    player_2_center_bonus = calculate_center_bonus(player_2_positions)
+    player_2_protection_bonus = calculate_protection_bonus(player_2_positions)
+    player_2_attack_bonus = calculate_attack_bonus(player_2_positions, state["player_1"])
+
+    # Toplam skor
+    player_1_score = len(player_1_positions) + player_1_center_bonus + player_1_protection_bonus + player_1_attack_bonus
+    player_2_score = len(player_2_positions) + player_2_center_bonus + player_2_protection_bonus + player_2_attack_bonus
+
+    return player_1_score - player_2_score
+
+
+
+def get_current_state():
+    """Mevcut oyun durumunu döndür."""
+    return {
+        "player_1": PLAYER_1["positions"],
+        "player_2": PLAYER_2["positions"]
+    }
+
+
+def is_valid_move(x, y, state=None):
+    """Hamlenin geçerli olup olmadığını kontrol eder.
+
+    state verilmezse mevcut oyun durumu (PLAYER_1/PLAYER_2) kullanılır.
+    """
+    if state is None:
+        state = get_current_state()
+    if not (0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE):
+        debug(f"Hedef kare ({x}, {y}) tahtanın dışında!")  # Debug
+        return False
+    if (x, y) in state["player_1"] or (x, y) in state["player_2"]:
+        debug(f"Hedef kare ({x}, {y}) dolu!")  # Debug
+        return False
+    debug(f"Hedef kare ({x}, {y}) geçerli.")  # Debug
+    return True
+
+def get_random_move(pos, state=None):
+    """Rastgele bir geçerli hareket döndürür."""
+    moves = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    random.shuffle(moves)
+    for dx, dy in moves:
+        new_x, new_y = pos[0] + dx, pos[1] + dy
+        if is_valid_move(new_x, new_y, state):
+            return (new_x, new_y)
+    return pos  # Eğer hareket yoksa mevcut pozisyonu döndür
+
+def get_possible_moves(state, player):
+    """Verilen oyun durumunda geçerli hamleleri döndür.
+
+    Yalnızca state okunur; global konumlara bakılmaz ve çıktı üretilmez.
+    """
+    possible_moves = []
+    positions = state["player_1"] if player == PLAYER_1 else state["player_2"]
+    occupied = set(state["player_1"])
+    occupied.update(state["player_2"])
+
+    for pos in positions:
+        x, y = pos
+        # Tüm olası hareketleri kontrol et (aşağı, yukarı, sağa, sola)
+        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            new_x, new_y = x + dx, y + dy
+            if 0 <= new_x < GRID_SIZE and 0 <= new_y < GRID_SIZE and (new_x, new_y) not in occupied:
+                possible_moves.append(((x, y), (new_x, new_y)))  # (eski_pozisyon, yeni_pozisyon)
+
+    return possible_moves
+
+
+def make_move(state, move, player):
+    """Oyun durumunu bir hareketle günceller."""
+    new_state = {
+        "player_1": state["player_1"][:],
+        "player_2": state["player_2"][:]
+    }
+    old_pos, new_pos = move
+    if player == PLAYER_1:
+        new_state["player_1"].remove(old_pos)
+        new_state["player_1"].append(new_pos)
+    else:
+        new_state["player_2"].remove(old_pos)
+        new_state["player_2"].append(new_pos)
+    return new_state
+
+def is_terminal_state(state):
+    """Oyun durumunun terminal durumda olup olmadığını kontrol eder."""
+    # Eğer herhangi bir oyuncunun taşı kalmamışsa terminal durumdur
+    if not state["player_1"]:  # PLAYER_1'in taşları tükenmişse
+        debug("PLAYER 2 kazandı!")
+        return True
+    if not state["player_2"]:  # PLAYER_2'nin taşları tükenmişse
+        debug("PLAYER 1 kazandı!")
+        return True
+    # Eğer başka bir terminal durum kuralı varsa buraya ekleyin
+    return False
+
+
+def apply_captures(moved_to, player_1=PLAYER_1, player_2=PLAYER_2):
+    """moved_to karesine yapılan hamleden sonra taş yeme kurallarını uygular.
+
+    Sandviç ve duvar kuralları bitboard.capture_at ile yalnızca hedef karenin
+    satırında ve sütununda denetlenir. Yenen taşlar konum listelerinden
+    silinir (kalan taşların sırası korunur); yenen konumlar döndürülür.
+    """
+    state = bitboard.from_positions(player_1["positions"], player_2["positions"])
+    p1, p2 = bitboard.capture_at(state.p1, state.p2, bitboard.square(*moved_to))
+    captured = []
+    for player, before, after in ((player_1, state.p1, p1), (player_2, state.p2, p2)):
+        if before != after:
+            removed = bitboard.positions_of(before & ~after)
+            player["positions"][:] = [pos for pos in player["positions"] if pos not in removed]
+            for pos in removed:
+                debug(f"Taş yok edildi: {pos}")
+            captured.extend(removed)
+    return captured
@@ -0,0 +1,499 @@
+"""
+Yapay zeka araması (Pygame bağımlılığı olmadan).
+
+Min-Max algoritması alpha-beta budaması ile bitboard durumları üzerinde
+çalışır; hamleler SearchBoard üzerinde yerinde uygulanıp geri alınır ve
+taş yeme kuralları arama ağacında da uygulanır. Ağaçtaki her adım oyundaki
+gibi bir turdur (iki taşı olan oyuncu için iki farklı taşın hamlesi);
+derinlik tur sayısıdır. Tur sınırı verilirse (turns_left) oyun sonu olarak
+değerlendirilir. Transpozisyon tablosu aynı
+konumların tekrar aranmasını önler; yinelemeli derinleştirme ise aramayı
+bir süre sınırı içinde tutar. Oyun sonu tablosu (engine.tablebase)
+verilirse az taşlı konumlar aranmadan kesin değerleriyle döner.
+
+Derinlik 0'daki yapraklarda sessizleşme araması yapılır: yalnızca taş
+yiyen turlar, yaprak başına bir düğüm bütçesiyle aranır; böylece bir hamle
+sonra gelecek yeme yaprak değerini bozmaz.
+"""
+
+import time
+from collections import namedtuple
+
+from engine import bitboard
+from engine.board import SearchBoard, apply_turn, generate_turns
+from engine.ordering import MoveOrderer
+from engine.symmetry import flip_turn
+from engine.tablebase import UNKNOWN
+from engine.transposition import EXACT, LOWER, UPPER, TranspositionTable
+
+MAX_DEPTH = 32
+TIME_CHECK_INTERVAL = 1024  # Süre kontrolü bu kadar düğümde bir yapılır
+QUIESCENCE_NODES = 64  # Yaprak başına sessizleşme araması düğüm bütçesi
+QUIESCENCE_PLY = 4  # Sessizleşme aramasının en çok tur derinliği
+
+# Kazanılan oyunun değeri; daha yakın kazanç daha yüksek puan alır
+WIN_SCORE = 10000
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+
+def terminal_score(state, ply):
+    """Bitmiş oyunun değeri (Player 1 açısından); ply kökten uzaklıktır."""
+    winner = bitboard.winner(state)
+    if winner == 1:
+        return WIN_SCORE - ply
+    if winner == 2:
+        return ply - WIN_SCORE
+    return 0
+
+
+def _score_to_tt(score, ply):
+    # Kazanç puanları tabloya düğüme göre (kökten bağımsız) yazılır
+    if score >= WIN_THRESHOLD:
+        return score + ply
+    if score <= -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score, ply):
+    if score >= WIN_THRESHOLD:
+        return score - ply
+    if score <= -WIN_THRESHOLD:
+        return score + ply
+    return score
+
+
+class SearchTimeout(Exception):
+    """Arama süresi dolduğunda ya da durdurulduğunda fırlatılır."""
+
+
+class SearchStats(namedtuple("SearchStats", [
+    "nodes", "qnodes", "leaves", "cutoffs", "tt_hits", "tb_hits", "depth", "max_ply", "elapsed",
+])):
+    """Bir aramanın (örneğin bir yapay zeka hamlesinin) ölçümleri.
+
+    nodes: ziyaret edilen düğüm; qnodes: bunlardan sessizleşme araması
+    düğümleri; leaves: değerlendirilen yaprak; cutoffs:
+    alpha-beta kesmesi; tt_hits: transpozisyon tablosunda bulunan konum;
+    tb_hits: oyun sonu tablosundan çözülen konum; depth: tamamlanan
+    derinlik; max_ply: ulaşılan en derin tur; elapsed: geçen süre (saniye).
+    """
+
+    __slots__ = ()
+
+    @property
+    def nps(self):
+        """Saniyedeki düğüm sayısı."""
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        """Ölçümleri (nps dahil) sözlük olarak döndürür."""
+        stats = self._asdict()
+        stats["nps"] = self.nps
+        return stats
+
+    def __str__(self):
+        return (f"derinlik {self.depth}/{self.max_ply}  {self.nodes} düğüm ({self.qnodes} sessiz)  {self.leaves} yaprak  "
+                f"{self.cutoffs} kesme  {self.tt_hits} TT  {self.tb_hits} TB  {self.elapsed:.2f} s  "
+                f"{self.nps:.0f} düğüm/s")
+
+
+class Searcher:
+    """Arama durumu: transpozisyon tablosu, hamle sıralayıcı, süre sınırı ve sayaçlar.
+
+    Sayaçlar (nodes, qnodes, leaves, cutoffs, tt_hits, tb_hits, max_ply) her
+    iterative_deepening() başında sıfırlanır; arama bitince özetleri stats
+    (SearchStats) olarak saklanır.
+
+    weights (bitboard.Weights) verilirse yapraklar evaluate_weighted() ile
+    değerlendirilir; verilmezse tahtanın artımlı evaluate() puanı kullanılır.
+
+    tablebase (engine.tablebase.Tablebase) verilirse toplam taş sayısı
+    tablonunkini geçmeyen konumlar (kök ve yapraklar dahil) tablodan okunur.
+
+    quiescence_nodes, yaprak başına sessizleşme araması bütçesidir; 0 ise
+    yapraklar doğrudan değerlendirilir.
+    """
+
+    def __init__(self, tt=None, orderer=None, weights=None, tablebase=None,
+                 quiescence_nodes=QUIESCENCE_NODES):
+        self.tt = tt if tt is not None else TranspositionTable()
+        self.orderer = orderer if orderer is not None else MoveOrderer()
+        self.weights = None if weights == bitboard.DEFAULT_WEIGHTS else weights
+        self.tablebase = tablebase
+        self.quiescence_nodes = quiescence_nodes
+        self._quiescence_budget = 0
+        self.deadline = None
+        self.stopped = False
+        self.completed_depth = -1
+        self.best_value = None
+        self.stats = None
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Arama sayaçlarını sıfırlar."""
+        self.nodes = 0
+        self.qnodes = 0
+        self.leaves = 0
+        self.cutoffs = 0
+        self.tt_hits = 0
+        self.tb_hits = 0
+        self.max_ply = 0
+
+    def counters(self):
+        """Sayaçları (nodes, qnodes, leaves, cutoffs, tt_hits, tb_hits, max_ply) demeti olarak döndürür."""
+        return self.nodes, self.qnodes, self.leaves, self.cutoffs, self.tt_hits, self.tb_hits, self.max_ply
+
+    def add_counters(self, counters):
+        """Başka bir aramanın (ör. işçi işlem) counters() değerlerini ekler."""
+        nodes, qnodes, leaves, cutoffs, tt_hits, tb_hits, max_ply = counters
+        self.nodes += nodes
+        self.qnodes += qnodes
+        self.leaves += leaves
+        self.cutoffs += cutoffs
+        self.tt_hits += tt_hits
+        self.tb_hits += tb_hits
+        self.max_ply = max(self.max_ply, max_ply)
+
+    def stop(self):
+        """Süreli aramayı başka bir iş parçacığından durdurur ("şimdi oyna").
+
+        Arama son tamamlanan derinliğin hamlesiyle döner. clear_stop()
+        çağrılana kadar sonraki aramalar da hemen durur.
+        """
+        self.stopped = True
+
+    def clear_stop(self):
+        """stop() isteğini temizler."""
+        self.stopped = False
+
+    def stop_requested(self):
+        """Durdurma istenip istenmediğini döndürür."""
+        return self.stopped
+
+    def _check_time(self):
+        # deadline None iken (ilk iterasyon, sabit derinlik) arama kesilmez
+        if self.deadline is not None and (self.stop_requested() or time.monotonic() >= self.deadline):
+            raise SearchTimeout()
+
+    def _probe_tablebase(self, board, ply):
+        """Konumun oyun sonu tablosundaki değerini (Player 1 açısından) döndürür.
+
+        Tablo mesafeleri tur sınırı olmayan oyuna göredir: kazanç/kayıp
+        yalnızca oyun tur sınırından önce bitiyorsa, beraberlik yalnızca tur
+        sınırı yoksa kesindir. Konum tabloda yoksa ya da sonuç kesin değilse
+        None döner.
+        """
+        tablebase = self.tablebase
+        if tablebase is None or bitboard.popcount(board.p1 | board.p2) > tablebase.max_pieces:
+            return None
+        value = tablebase.probe(board, board.player)
+        if value is None or value == UNKNOWN:
+            return None
+        if value == 0:
+            return 0 if board.turns_left is None else None
+        distance = abs(value)
+        if board.turns_left is not None:
+            # Oyun sonuna kadar kalan yarım tur: son tur her zaman Player 1'indir
+            remaining = 2 * board.turns_left - (1 if board.player == 1 else 0)
+            if distance > remaining:
+                return None
+        if (value > 0) == (board.player == 1):
+            return WIN_SCORE - (ply + distance)
+        return ply + distance - WIN_SCORE
+
+    def minimax_alpha_beta(self, state, depth, alpha, beta, maximizing_player, turns_left=None):
+        """Minimax algoritmasının alpha-beta pruning ile uygulanması.
+
+        state, bitboard.BitState türünde bir durumdur; arama bir SearchBoard
+        üzerinde hamleleri yerinde uygulayıp geri alarak yapılır. turns_left,
+        Player 1'in kalan tur sayısıdır (None ise tur sınırı yok).
+        """
+        board = SearchBoard(state, 1 if maximizing_player else 2, turns_left)
+        return self._search(board, depth, alpha, beta, 0)
+
+    def _search(self, board, depth, alpha, beta, ply):
+        """Alpha-beta araması; board.player 1 ise maksimize, 2 ise minimize eder.
+
+        depth ve ply tur cinsindendir; ply kökten itibaren tur numarasıdır
+        (katil hamleler ve kazanç mesafesi için).
+        """
+        self.nodes += 1
+        if not self.nodes % TIME_CHECK_INTERVAL:
+            self._check_time()
+        if ply > self.max_ply:
+            self.max_ply = ply
+
+        if board.is_game_over():
+            return terminal_score(board, ply)
+        if self.tablebase is not None:
+            value = self._probe_tablebase(board, ply)
+            if value is not None:
+                self.tb_hits += 1
+                return value
+        if depth == 0:
+            if not self.quiescence_nodes:
+                return self._evaluate(board)
+            self._quiescence_budget = self.quiescence_nodes
+            return self._quiescence(board, alpha, beta, ply, 0)
+
+        tt = self.tt
+        # Konum ve dikey aynası aynı kaydı paylaşır; kayıttaki tur küçük
+        # anahtarlı konuma göredir
+        key = board.key
+        mirrored = board.mirror_key < key
+        if mirrored:
+            key = board.mirror_key
+        entry = tt.probe(key)
+        tt_turn = None
+        if entry is not None:
+            self.tt_hits += 1
+            _, entry_depth, entry_score, entry_flag, tt_turn, _ = entry
+            if mirrored and tt_turn:
+                tt_turn = flip_turn(tt_turn)
+            if entry_depth >= depth:
+                entry_score = _score_from_tt(entry_score, ply)
+                if entry_flag == EXACT:
+                    return entry_score
+                if entry_flag == LOWER:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if beta <= alpha:
+                    return entry_score
+        alpha_orig, beta_orig = alpha, beta
+
+        player = board.player
+        orderer = self.orderer
+
+        def order(moves):
+            return orderer.order(board, moves, player, ply)
+
+        # Önceki iterasyonun en iyi turu (ana varyant) önce denenir
+        turns = board.turns(order, tt_turn)
+        best_turn = None
+        try:
+            if player == 1:
+                best_eval = float('-inf')
+                for turn in turns:
+                    eval = self._search(board, depth - 1, alpha, beta, ply + 1)
+                    if eval > best_eval:
+                        best_eval = eval
+                        best_turn = turn
+                    alpha = max(alpha, eval)
+                    if beta <= alpha:
+                        self.cutoffs += 1
+                        for move in turn:
+                            orderer.record_cutoff(move, player, ply, depth)
+                        break  # Alpha-beta pruning
+            else:
+                best_eval = float('inf')
+                for turn in turns:
+                    eval = self._search(board, depth - 1, alpha, beta, ply + 1)
+                    if eval < best_eval:
+                        best_eval = eval
+                        best_turn = turn
+                    beta = min(beta, eval)
+                    if beta <= alpha:
+                        self.cutoffs += 1
+                        for move in turn:
+                            orderer.record_cutoff(move, player, ply, depth)
+                        break  # Alpha-beta pruning
+        finally:
+            turns.close()  # Uygulanmış tur geri alınır
+
+        if best_eval <= alpha_orig:
+            flag = UPPER
+        elif best_eval >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if mirrored and best_turn:
+            best_turn = flip_turn(best_turn)
+        tt.store(key, depth, _score_to_tt(best_eval, ply), flag, best_turn)
+        return best_eval
+
+    def _evaluate(self, board):
+        self.leaves += 1
+        if self.weights is not None:
+            return bitboard.evaluate_weighted(board, self.weights)
+        return board.score  # Mevcut durumun değerlendirme değeri
+
+    def _quiescence(self, board, alpha, beta, ply, qply):
+        """Yalnızca taş yiyen turları arayan sessizleşme araması.
+
+        Sıradaki oyuncu yemeyi reddedip durağan değerde kalabilir (stand
+        pat). Yaprağın düğüm bütçesi ya da QUIESCENCE_PLY dolunca konum
+        doğrudan değerlendirilir.
+        """
+        if qply:
+            self.nodes += 1
+            self.qnodes += 1
+            if not self.nodes % TIME_CHECK_INTERVAL:
+                self._check_time()
+            if ply > self.max_ply:
+                self.max_ply = ply
+            if board.is_game_over():
+                return terminal_score(board, ply)
+            if self.tablebase is not None:
+                value = self._probe_tablebase(board, ply)
+                if value is not None:
+                    self.tb_hits += 1
+                    return value
+
+        stand_pat = self._evaluate(board)
+        if qply >= QUIESCENCE_PLY or self._quiescence_budget <= 0:
+            return stand_pat
+        player = board.player
+        if player == 1:
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+        else:
+            if stand_pat <= alpha:
+                return stand_pat
+            beta = min(beta, stand_pat)
+
+        best_eval = stand_pat
+        turns = board.capture_turns()
+        try:
+            for _ in turns:
+                self._quiescence_budget -= 1
+                eval = self._quiescence(board, alpha, beta, ply + 1, qply + 1)
+                if player == 1:
+                    best_eval = max(best_eval, eval)
+                    alpha = max(alpha, eval)
+                else:
+                    best_eval = min(best_eval, eval)
+                    beta = min(beta, eval)
+                if beta <= alpha or self._quiescence_budget <= 0:
+                    break
+        finally:
+            turns.close()  # Uygulanmış tur geri alınır
+        return best_eval
+
+    def search_root(self, state, depth, turns=None, turns_left=None, player=1):
+        """player'ın (varsayılan Player 1) kök turlarını verilen derinlikte arar.
+
+        Turlar verilen sırayla denenir. (en_iyi_tur, değer, skorlar) döner;
+        değerler Player 1 açısındandır, Player 2 en küçüğünü seçer. Skorlar
+        her turun değeridir (budanan turlar için bir sınır).
+        """
+        if turns is None:
+            turns = generate_turns(state, player)
+        board = SearchBoard(state, player, turns_left)
+        best_turn = None
+        best_value = float('-inf') if player == 1 else float('inf')
+        scores = {}
+        for turn in turns:
+            board.push_turn(turn)  # Ardından rakibin turu simüle edilir
+            if player == 1:
+                turn_value = self._search(board, depth, best_value, float('inf'), 1)
+                better = turn_value > best_value
+            else:
+                turn_value = self._search(board, depth, float('-inf'), best_value, 1)
+                better = turn_value < best_value
+            board.pop_turn(turn)
+            scores[turn] = turn_value
+            if better:
+                best_value = turn_value
+                best_turn = turn
+        return best_turn, best_value, scores
+
+    def table_turn(self, state, turns_left=None, player=1):
+        """Konumun transpozisyon tablosundaki en iyi turunu döndürür, yoksa None.
+
+        Önceki aramanın ana varyantındaki konumlar için rakibin beklenen
+        turudur. Dönen tur generate_turns() listesinden aynı konuma varan
+        turdur (tablodaki tur aynalanmış konuma ait olabilir).
+        """
+        board = SearchBoard(state, player, turns_left)
+        mirrored = board.mirror_key < board.key
+        entry = self.tt.probe(board.mirror_key if mirrored else board.key)
+        if entry is None or not entry[4]:
+            return None
+        turn = flip_turn(entry[4]) if mirrored else entry[4]
+        results = {apply_turn(state, candidate, player): candidate for candidate in generate_turns(state, player)}
+        return results.get(apply_turn(state, turn, player))
+
+    def iterative_deepening(self, state, time_limit=1.0, max_depth=MAX_DEPTH, turns_left=None, player=1):
+        """Süre dolana kadar derinliği artırarak arar.
+
+        time_limit None ise arama max_depth'e ya da stop() çağrısına kadar
+        sürer. Son tamamlanan derinliğin en iyi turunu (hamle demeti)
+        döndürür, hamle yoksa None. turns_left verilirse arama oyun sonunun
+        ötesine geçmez. player, turu aranan oyuncudur.
+        Her iterasyonda kök turları bir önceki iterasyonun skorlarına göre
+        sıralanır; daha derindeki ana varyant tablodan okunur. Arama
+        ölçümleri self.stats'a yazılır.
+        """
+        start = time.monotonic()
+        self.tt.new_search()
+        self.orderer.new_search()
+        self.reset_counters()
+        self.completed_depth = -1
+        self.best_value = None
+        self.stats = None
+        if not bitboard.generate_moves(state, player):
+            return None
+        turns = generate_turns(state, player)
+        if turns_left is not None:
+            # Kök turundan sonra oyun bitene kadar kalan tur sayısı
+            remaining = 2 * turns_left - 2 if player == 1 else 2 * turns_left - 1
+            max_depth = max(0, min(max_depth, remaining))
+
+        # İlk iterasyon süre sınırı olmadan çalışır, böylece her zaman bir tur bulunur
+        self.deadline = None
+        best_turn, self.best_value, scores = self.search_root(state, 0, turns, turns_left, player)
+        self.completed_depth = 0
+        if self.tablebase is not None and self._probe_tablebase(SearchBoard(state, player, turns_left), 0) is not None:
+            # Kök oyun sonu tablosunda: derinlik 0'da bütün turlar tablodan kesin değer aldı
+            max_depth = 0
+
+        if time_limit is None:
+            self.deadline = float('inf')
+        else:
+            self.deadline = time.monotonic() + time_limit
+        try:
+            for depth in range(1, max_depth + 1):
+                turns.sort(key=lambda turn: scores[turn], reverse=player == 1)
+                turns.remove(best_turn)
+                turns.insert(0, best_turn)
+                turn, value, scores = self.search_root(state, depth, turns, turns_left, player)
+                best_turn, self.best_value = turn, value
+                self.completed_depth = depth
+                if self.stop_requested() or time.monotonic() >= self.deadline:
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+        self.stats = SearchStats(self.nodes, self.qnodes, self.leaves, self.cutoffs, self.tt_hits,
+                                 self.tb_hits, self.completed_depth, self.max_ply, time.monotonic() - start)
+        return best_turn
+
+
+def minimax_alpha_beta(state, depth, alpha, beta, maximizing_player, tt=None, turns_left=None):
+    """Minimax algoritmasının alpha-beta pruning ile uygulanması.
+
+    state, bitboard.BitState türünde bir durumdur. tt verilirse
+    (transposition.TranspositionTable) sonuçlar tabloda saklanır ve okunur.
+    """
+    return Searcher(tt).minimax_alpha_beta(state, depth, alpha, beta, maximizing_player, turns_left)
+
+
+def find_best_move(state, depth=3, tt=None, turns_left=None):
+    """Player 1 için sabit derinlikte en iyi turu bulur.
+
+    Tur, (kaynak, hedef) kare numaralarından oluşan hamlelerin demeti olarak
+    döner; hamle yoksa boş demet.
+    """
+    searcher = Searcher(tt)
+    searcher.tt.new_search()
+    searcher.orderer.new_search()
+    return searcher.search_root(state, depth, turns_left=turns_left)[0]
+
+
+def iterative_deepening(state, time_limit=1.0, max_depth=MAX_DEPTH, tt=None, turns_left=None):
+    """Player 1 için süre sınırlı yinelemeli derinleştirme ile en iyi turu bulur."""
+    return Searcher(tt).iterative_deepening(state, time_limit, max_depth, turns_left)
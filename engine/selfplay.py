@@ -0,0 +1,197 @@
+"""
+Yapay zekaya karşı yapay zeka oyunları (Pygame olmadan, toplu çalıştırma).
+
+İki motor yapılandırması (derinlik, süre, değerlendirme katsayıları) N oyun
+boyunca karşılaştırılır. Oyunlar bir işlem havuzunda paralel oynanır; her
+oyun çifti aynı rastgele açılışla başlar ve motorlar taraf değiştirir.
+
+Oyunlar --record ile ikili oyun kaydı dosyasına eklenebilir (engine.record).
+
+Kullanım: python -m engine.selfplay --games 200 --a-depth 2 --b-depth 1
+"""
+
+import argparse
+import multiprocessing
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import bitboard
+from engine.board import apply_turn, generate_turns
+from engine.record import GameWriter
+from engine.rules import MAX_TURNS, PLAYER_1, PLAYER_2
+from engine.search import MAX_DEPTH, QUIESCENCE_NODES, Searcher
+from engine.transposition import ZOBRIST_TURNS
+
+# depth: tur cinsinden en büyük derinlik (None: sınırsız); time_limit: tur
+# başına düşünme süresi (None: süre sınırı yok); quiescence: yaprak başına
+# sessizleşme araması bütçesi (0: kapalı)
+EngineConfig = namedtuple(
+    "EngineConfig", ["depth", "time_limit", "weights", "quiescence"],
+    defaults=(2, None, bitboard.DEFAULT_WEIGHTS, QUIESCENCE_NODES),
+)
+
+# winner: 1, 2 ya da 0 (beraberlik); a_player: A motorunun oynadığı taraf;
+# turns: oynanan Player 1 turu; nodes ve search_time: (A, B) demetleri;
+# history: oynanan turlar (hamle demetleri) sırasıyla
+GameResult = namedtuple(
+    "GameResult", ["winner", "a_player", "turns", "nodes", "search_time", "history"],
+    defaults=((),),
+)
+
+INITIAL_STATE = bitboard.from_positions(PLAYER_1["positions"], PLAYER_2["positions"])
+
+
+def play_game(engine_a, engine_b, a_player=1, opening_turns=2, seed=0, max_turns=MAX_TURNS):
+    """Bir oyunu sonuna kadar oynar ve GameResult döndürür.
+
+    İlk opening_turns tur (her iki taraf için) seed ile seçilen rastgele
+    turlardır; böylece belirlenimci motorlar farklı oyunlar oynar.
+    """
+    rng = random.Random(seed)
+    engines = {
+        a_player: (0, Searcher(weights=engine_a.weights, quiescence_nodes=engine_a.quiescence), engine_a),
+        3 - a_player: (1, Searcher(weights=engine_b.weights, quiescence_nodes=engine_b.quiescence), engine_b),
+    }
+    nodes = [0, 0]
+    search_time = [0.0, 0.0]
+    history = []
+
+    state = INITIAL_STATE
+    player = 1
+    turns_left = max_turns
+    half_turns = 0
+    while not bitboard.is_terminal(state) and not (player == 2 and turns_left == 0):
+        if half_turns < 2 * opening_turns:
+            turn = rng.choice(generate_turns(state, player))
+        else:
+            index, searcher, config = engines[player]
+            max_depth = MAX_DEPTH if config.depth is None else config.depth
+            turn = searcher.iterative_deepening(state, config.time_limit, max_depth, turns_left, player)
+            if searcher.stats is not None:
+                nodes[index] += searcher.stats.nodes
+                search_time[index] += searcher.stats.elapsed
+        turn = turn or ()
+        history.append(turn)
+        state = apply_turn(state, turn, player)
+        if player == 1:
+            turns_left -= 1
+        player = 3 - player
+        half_turns += 1
+
+    return GameResult(bitboard.winner(state), a_player, max_turns - turns_left,
+                      tuple(nodes), tuple(search_time), tuple(history))
+
+
+def _play_indexed(args):
+    return play_game(*args)
+
+
+def run_match(engine_a, engine_b, games, workers=None, opening_turns=2, seed=0, max_turns=MAX_TURNS):
+    """games oyunu oynar ve GameResult listesini döndürür.
+
+    Ardışık iki oyun aynı açılışı kullanır, A motoru birinde Player 1,
+    diğerinde Player 2 olur. workers 1 ise oyunlar bu işlemde oynanır.
+    """
+    tasks = [
+        (engine_a, engine_b, 1 if i % 2 == 0 else 2, opening_turns, seed + i // 2, max_turns)
+        for i in range(games)
+    ]
+    workers = workers or multiprocessing.cpu_count()
+    if workers == 1:
+        return [_play_indexed(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, games // (workers * 4))
+        return list(pool.map(_play_indexed, tasks, chunksize=chunksize))
+
+
+def summarize(results):
+    """Sonuçları A motoru açısından özetler (galibiyet, beraberlik, yenilgi...)."""
+    wins = draws = losses = 0
+    nodes = [0, 0]
+    search_time = [0.0, 0.0]
+    for result in results:
+        if result.winner == 0:
+            draws += 1
+        elif result.winner == result.a_player:
+            wins += 1
+        else:
+            losses += 1
+        for i in range(2):
+            nodes[i] += result.nodes[i]
+            search_time[i] += result.search_time[i]
+    games = len(results)
+    return {
+        "games": games,
+        "wins": wins,
+        "draws": draws,
+        "losses": losses,
+        "score": (wins + draws / 2) / games if games else 0.0,
+        "average_turns": sum(r.turns for r in results) / games if games else 0.0,
+        "nps": tuple(n / t if t else 0.0 for n, t in zip(nodes, search_time)),
+    }
+
+
+def _weights(text):
+    try:
+        values = [float(value) for value in text.split(",")]
+    except ValueError:
+        values = []
+    if len(values) != len(bitboard.Weights._fields):
+        raise argparse.ArgumentTypeError("katsayılar 'taş,merkez,koruma' biçiminde olmalı, ör. 1,1,1")
+    return bitboard.Weights(*values)
+
+
+def main(argv=None):
+    """İki motoru karşılaştırır ve sonuçları yazdırır."""
+    parser = argparse.ArgumentParser(description="Yapay zekaya karşı yapay zeka oyunları")
+    parser.add_argument("--games", type=int, default=100, help="oyun sayısı")
+    parser.add_argument("--workers", type=int, default=None, help="işlem sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument("--opening-turns", type=int, default=2, help="rastgele açılış turu sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="açılışlar için rastgele tohum")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS, help="oyun başına tur sınırı")
+    parser.add_argument("--record", help="oyunların ekleneceği kayıt dosyası")
+    for name in ("a", "b"):
+        parser.add_argument(f"--{name}-depth", type=int, default=None, help=f"{name.upper()} motorunun derinliği (tur)")
+        parser.add_argument(f"--{name}-time", type=float, default=None, help=f"{name.upper()} motorunun tur başına süresi (saniye)")
+        parser.add_argument(f"--{name}-weights", type=_weights, default=bitboard.DEFAULT_WEIGHTS,
+                            help=f"{name.upper()} motorunun değerlendirme katsayıları: taş,merkez,koruma")
+        parser.add_argument(f"--{name}-quiescence", type=int, default=QUIESCENCE_NODES,
+                            help=f"{name.upper()} motorunun yaprak başına sessizleşme bütçesi (0: kapalı)")
+    args = parser.parse_args(argv)
+    # Zobrist anahtarları en fazla len(ZOBRIST_TURNS) - 1 kalan tur için tanımlı
+    if not 0 < args.max_turns < len(ZOBRIST_TURNS):
+        parser.error(f"--max-turns 1 ile {len(ZOBRIST_TURNS) - 1} arasında olmalı: {args.max_turns}")
+
+    engines = []
+    for name in ("a", "b"):
+        depth = getattr(args, f"{name}_depth")
+        time_limit = getattr(args, f"{name}_time")
+        if depth is None and time_limit is None:
+            depth = EngineConfig().depth
+        engines.append(EngineConfig(depth, time_limit, getattr(args, f"{name}_weights"),
+                                    getattr(args, f"{name}_quiescence")))
+
+    start = time.perf_counter()
+    results = run_match(engines[0], engines[1], args.games, args.workers,
+                        args.opening_turns, args.seed, args.max_turns)
+    elapsed = time.perf_counter() - start
+    summary = summarize(results)
+    if args.record:
+        with GameWriter(args.record) as writer:
+            for result in results:
+                writer.write_game(INITIAL_STATE, result.history, result.winner, 1, args.max_turns)
+
+    for name, engine in zip("AB", engines):
+        print(f"{name}: derinlik={engine.depth} süre={engine.time_limit} katsayılar={tuple(engine.weights)} "
+              f"sessizleşme={engine.quiescence}")
+    print(f"oyun: {summary['games']}  A kazandı: {summary['wins']}  beraberlik: {summary['draws']}  "
+          f"A kaybetti: {summary['losses']}  A skoru: {summary['score']:.3f}")
+    print(f"ortalama oyun uzunluğu: {summary['average_turns']:.1f} tur")
+    print(f"düğüm/saniye: A {summary['nps'][0]:.0f}  B {summary['nps'][1]:.0f}")
+    print(f"toplam süre: {elapsed:.1f} s ({summary['games'] / elapsed:.1f} oyun/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+Çok oyunlu sunucu: tek işlemde yüzlerce GameSession, asyncio ile.
+
+İstemciler TCP üzerinden satır başına bir JSON nesnesi gönderir ve her
+isteğe bir JSON satırıyla yanıt alır:
+    {"cmd": "new", "max_turns": 50}                 yeni oyun (yapay zeka başlar)
+    {"cmd": "move", "session": 3, "move": [[0, 4], [1, 4]]}
+    {"cmd": "state", "session": 3}
+    {"cmd": "close", "session": 3}
+    {"cmd": "stats"}                                sunucu ölçümleri
+Yanıt {"ok": true, "state": {...}} (GameSession.to_dict) ya da
+{"ok": false, "error": "..."} biçimindedir. İnsanın turunu bitiren hamlenin
+yanıtı yapay zekanın cevabından sonra gelir; bir bağlantı birden fazla
+oturum açabilir, ancak yalnızca kendi açtığı oturumları görebilir ve
+oynayabilir.
+
+Yapay zeka aramaları bütün oturumların paylaştığı bir işlem havuzunda
+yürür. Havuzun işçi sayısından fazla arama beklerse, bekleyenlerden o ana
+kadar en az arama süresi harcamış oturumunki önce başlar; böylece uzun
+düşünen oyunlar diğerlerini bekletmez. Her oturumun oyun boyunca toplam
+bir düşünme bütçesi vardır: tur süresi kalan bütçenin kalan turlara
+bölünmesiyle sınırlanır, bütçe biten oturum derinlik 0 aramasıyla oynar.
+
+Kullanım:
+    python -m engine.server --port 8765 --workers 4
+    python -m engine.server --clients 200      yerel istemcilerle yük denemesi
+"""
+
+import argparse
+import asyncio
+import functools
+import heapq
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import bitboard
+from engine.book import OpeningBook
+from engine.rules import MAX_TURNS
+from engine.search import Searcher
+from engine.session import AI_PLAYER, GameSession
+from engine.tablebase import open_in_worker
+
+ASSETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+BOOK_PATH = os.path.join(ASSETS, "opening_book.bin")
+TABLEBASE_PATH = os.path.join(ASSETS, "tablebase.bin")
+
+DEFAULT_PORT = 8765
+TURN_TIME = 0.5         # Yapay zekanın tur başına en uzun düşünme süresi (saniye)
+SESSION_BUDGET = 10.0   # Oturumun oyun boyunca toplam düşünme süresi (saniye)
+MAX_SEARCH_DEPTH = 4    # Sunucu aramalarında en büyük derinlik (tur)
+MAX_SESSIONS = 1000
+
+# İşçi işlem durumu (_init_worker ile kurulur)
+_worker_searcher = None
+
+
+def _init_worker(tablebase_path=None):
+    global _worker_searcher
+    _worker_searcher = Searcher(tablebase=open_in_worker(tablebase_path))
+
+
+def _search_turn(state, player, turns_left, time_limit, max_depth):
+    """İşçide bir turu arar: (tur, harcanan süre, düğüm sayısı) döndürür.
+
+    Transpozisyon tablosu işçideki bütün oturumların aramalarında ortaktır;
+    anahtarlar konuma bağlı olduğundan oyunlar birbirini bozmaz.
+    """
+    searcher = _worker_searcher
+    start = time.monotonic()
+    turn = searcher.iterative_deepening(state, time_limit, max_depth, turns_left, player)
+    nodes = searcher.stats.nodes if searcher.stats is not None else 0
+    return turn, time.monotonic() - start, nodes
+
+
+def _is_int(value):
+    # JSON'daki true/false Python'da bool (int'in alt sınıfı) olarak gelir
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class SearchScheduler:
+    """Oturumların aramalarını paylaşılan işlem havuzunda adil sırayla yürütür.
+
+    Aynı anda en fazla workers arama çalışır; bekleyen aramalardan oturumu
+    en az arama süresi harcamış olan önce başlar (eşitlikte geliş sırası).
+    close() ile kapatılmalıdır.
+    """
+
+    def __init__(self, workers=None, turn_time=TURN_TIME, session_budget=SESSION_BUDGET,
+                 max_depth=MAX_SEARCH_DEPTH, tablebase_path=None):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.turn_time = turn_time
+        self.session_budget = session_budget
+        self.max_depth = max_depth
+        # fork ile açılan işçiler o anda açık istemci soketlerini miras alır ve
+        # bağlantılar kapanmaz; işçiler temiz bir yorumlayıcıyla başlatılır
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                                         initializer=_init_worker, initargs=(tablebase_path,))
+        self._waiting = []  # (harcanan süre, sıra, oturum, future) yığını
+        self._order = itertools.count()
+        self.running = 0
+        self.searches = 0
+        self.nodes = 0
+        self.search_time = 0.0
+
+    def time_limit(self, session):
+        """Oturumun bu turdaki düşünme süresi: kalan bütçenin kalan turlara payı."""
+        remaining = max(0.0, self.session_budget - session.search_time)
+        return min(self.turn_time, remaining / max(1, session.turns_left))
+
+    @property
+    def waiting(self):
+        """Sırada bekleyen arama sayısı."""
+        return len(self._waiting)
+
+    async def search(self, session):
+        """Oturumun sıradaki turunu havuzda arar ve turu döndürür (hamle yoksa None)."""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (session.search_time, next(self._order), session, future))
+        self._dispatch()
+        return await future
+
+    def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while self._waiting and self.running < self.workers:
+            _, _, session, future = heapq.heappop(self._waiting)
+            if future.cancelled():
+                continue  # İstemci bağlantısı kapandı
+            self.running += 1
+            job = loop.run_in_executor(self._pool, _search_turn, session.state, session.player,
+                                       session.turns_left, self.time_limit(session), self.max_depth)
+            job.add_done_callback(functools.partial(self._finished, session, future))
+
+    def _finished(self, session, future, job):
+        self.running -= 1
+        if job.cancelled():
+            # Havuz kapatılırken iptal edilen iş; bekleyen istek de iptal edilir
+            future.cancel()
+        else:
+            error = job.exception()
+            if error is None:
+                turn, elapsed, nodes = job.result()
+                session.search_time += elapsed
+                self.search_time += elapsed
+                self.searches += 1
+                self.nodes += nodes
+            if not future.cancelled():
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(turn)
+        self._dispatch()
+
+    def close(self):
+        """İşlem havuzunu kapatır; bekleyen aramalar iptal edilir."""
+        for _, _, _, future in self._waiting:
+            future.cancel()
+        self._waiting = []
+        # _dispatch havuza en fazla workers iş verdiğinden havuzda bekleyen
+        # iş yoktur; yalnızca çalışan aramaların bitmesi beklenir
+        self._pool.shutdown(wait=True)
+
+
+class GameServer:
+    """Oturumları tutan ve istemci isteklerini işleyen asyncio sunucusu."""
+
+    def __init__(self, scheduler, opening_book=None, max_sessions=MAX_SESSIONS):
+        self.scheduler = scheduler
+        self.opening_book = opening_book
+        self.max_sessions = max_sessions
+        self.sessions = {}
+        self._locks = {}
+        self._ids = itertools.count(1)
+        self._connections = set()
+        self.games_finished = 0
+
+    async def ai_turns(self, session):
+        """Sıra yapay zekadaysa (oyun bitene ya da sıra insana geçene kadar) oynar."""
+        while session.player == AI_PLAYER and not session.is_over():
+            turn = None
+            if self.opening_book is not None:
+                turn = self.opening_book.lookup(session.state, session.player)
+            if turn is None:
+                turn = await self.scheduler.search(session)
+            session.play_turn(turn)
+        if session.is_over():
+            self.games_finished += 1
+
+    def _session(self, request, owned):
+        # Başka bağlantıların oturumları yokmuş gibi davranılır
+        session_id = request.get("session")
+        if not _is_int(session_id) or session_id not in owned or session_id not in self.sessions:
+            raise ValueError(f"Oturum yok: {session_id}")
+        return self.sessions[session_id]
+
+    async def handle_request(self, request, owned):
+        """Tek bir isteği işler ve yanıt nesnesini döndürür.
+
+        owned, bağlantının açtığı oturumların kümesidir; bağlantı yalnızca
+        bu oturumlara erişebilir ve bağlantı kapanınca bu oturumlar silinir.
+        Geçersiz isteklerde ValueError fırlatır.
+        """
+        command = request.get("cmd")
+        if command == "new":
+            if len(self.sessions) >= self.max_sessions:
+                raise ValueError("Oturum sınırına ulaşıldı")
+            max_turns = request.get("max_turns", MAX_TURNS)
+            if not _is_int(max_turns) or not 0 < max_turns <= MAX_TURNS:
+                raise ValueError(f"Geçersiz tur sınırı: {max_turns}")
+            session = GameSession(next(self._ids), max_turns=max_turns)
+            self.sessions[session.session_id] = session
+            self._locks[session.session_id] = asyncio.Lock()
+            owned.add(session.session_id)
+            async with self._locks[session.session_id]:
+                await self.ai_turns(session)
+            return {"ok": True, "state": session.to_dict()}
+        if command == "move":
+            session = self._session(request, owned)
+            try:
+                move = bitboard.move_from_coords(request["move"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Geçersiz hamle: {request.get('move')}") from None
+            async with self._locks[session.session_id]:
+                if session.play_move(move):
+                    await self.ai_turns(session)
+            return {"ok": True, "state": session.to_dict()}
+        if command == "state":
+            return {"ok": True, "state": self._session(request, owned).to_dict()}
+        if command == "close":
+            session = self._session(request, owned)
+            self._close_session(session.session_id)
+            owned.discard(session.session_id)
+            return {"ok": True}
+        if command == "stats":
+            return {"ok": True, "stats": self.stats()}
+        raise ValueError(f"Bilinmeyen komut: {command}")
+
+    def _close_session(self, session_id):
+        self.sessions.pop(session_id, None)
+        self._locks.pop(session_id, None)
+
+    def stats(self):
+        """Sunucu ölçümleri: oturum, arama ve kuyruk sayıları."""
+        scheduler = self.scheduler
+        return {
+            "sessions": len(self.sessions),
+            "games_finished": self.games_finished,
+            "searches": scheduler.searches,
+            "running": scheduler.running,
+            "waiting": scheduler.waiting,
+            "nodes": scheduler.nodes,
+            "search_time": round(scheduler.search_time, 3),
+        }
+
+    async def handle_client(self, reader, writer):
+        """Bir bağlantının isteklerini sırayla işler."""
+        owned = set()
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("İstek bir JSON nesnesi olmalı")
+                    response = await self.handle_request(request, owned)
+                except ValueError as error:  # json.JSONDecodeError da ValueError'dır
+                    response = {"ok": False, "error": str(error)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for session_id in owned:
+                self._close_session(session_id)
+            self._connections.discard(task)
+            writer.close()
+
+    async def wait_connections(self):
+        """Açık bağlantıların kapanmasını bekler."""
+        await asyncio.gather(*self._connections)
+
+
+class Client:
+    """Sunucuya bağlanan basit istemci (deneme ve yük testi için)."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=DEFAULT_PORT):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, **request):
+        """İsteği gönderir ve yanıtı döndürür; hata yanıtında ValueError fırlatır."""
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        if not response["ok"]:
+            raise ValueError(response["error"])
+        return response
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play_random_game(host, port, seed, max_turns=MAX_TURNS):
+    """Sunucuya karşı rastgele hamlelerle bir oyun oynar; kazananı döndürür."""
+    rng = random.Random(seed)
+    client = await Client.connect(host, port)
+    try:
+        state = (await client.request(cmd="new", max_turns=max_turns))["state"]
+        while not state["over"]:
+            move = rng.choice(state["moves"])
+            state = (await client.request(cmd="move", session=state["session"], move=move))["state"]
+        await client.request(cmd="close", session=state["session"])
+        return state["winner"]
+    finally:
+        await client.close()
+
+
+async def run_clients(host, port, clients, max_turns=MAX_TURNS, seed=0):
+    """clients oyunu aynı anda oynatır ve sonuçları (P1, P2, beraberlik) sayar."""
+    winners = await asyncio.gather(*(play_random_game(host, port, seed + i, max_turns) for i in range(clients)))
+    return winners.count(1), winners.count(2), winners.count(0)
+
+
+async def serve(args):
+    """Sunucuyu başlatır; --clients verilirse yerel istemcileri oynatıp kapanır."""
+    tablebase_path = None
+    if not args.no_tablebase and os.path.exists(args.tablebase):
+        tablebase_path = args.tablebase
+    opening_book = None
+    if not args.no_book and os.path.exists(args.book):
+        opening_book = OpeningBook(args.book)
+    scheduler = SearchScheduler(args.workers, args.time, args.budget, args.depth, tablebase_path)
+    game_server = GameServer(scheduler, opening_book, args.max_sessions)
+    server = await asyncio.start_server(game_server.handle_client, args.host, args.port,
+                                        limit=2 ** 16, backlog=max(100, args.clients))
+    try:
+        async with server:
+            if not args.clients:
+                print(f"{args.host}:{args.port} dinleniyor ({scheduler.workers} işçi)")
+                await server.serve_forever()
+            start = time.monotonic()
+            port = server.sockets[0].getsockname()[1]
+            p1, p2, draws = await run_clients(args.host, port, args.clients, args.max_turns)
+            await game_server.wait_connections()
+            elapsed = time.monotonic() - start
+            stats = game_server.stats()
+            print(f"{args.clients} oyun {elapsed:.1f} s  yapay zeka: {p1}  rastgele: {p2}  "
+                  f"beraberlik: {draws}  arama: {stats['searches']}  düğüm: {stats['nodes']}")
+    finally:
+        scheduler.close()
+        if opening_book is not None:
+            opening_book.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çok oyunlu oyun sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0: boş bir port seç")
+    parser.add_argument("--workers", type=int, default=None, help="arama işlemi sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--time", type=float, default=TURN_TIME, help="tur başına en uzun düşünme süresi (saniye)")
+    parser.add_argument("--budget", type=float, default=SESSION_BUDGET, help="oturum başına toplam düşünme süresi (saniye)")
+    parser.add_argument("--depth", type=int, default=MAX_SEARCH_DEPTH, help="en büyük arama derinliği (tur)")
+    parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    parser.add_argument("--book", default=BOOK_PATH, help="açılış kitabı dosyası")
+    parser.add_argument("--no-book", action="store_true", help="açılış kitabını kullanma")
+    parser.add_argument("--tablebase", default=TABLEBASE_PATH, help="oyun sonu tablosu dosyası")
+    parser.add_argument("--no-tablebase", action="store_true", help="oyun sonu tablosunu kullanma")
+    parser.add_argument("--clients", type=int, default=0,
+                        help="sunucuya bağlanıp rastgele oynayan yerel istemci sayısı (yük denemesi)")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS, help="yük denemesindeki oyunların tur sınırı")
+    args = parser.parse_args(argv)
+    if args.clients and args.port == DEFAULT_PORT:
+        args.port = 0
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
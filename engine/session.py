@@ -0,0 +1,116 @@
+"""
+Tek bir oyunun durumu (Pygame ve modül değişkenleri olmadan).
+
+game.py oyun durumunu modül değişkenlerinde tuttuğu için bir işlemde tek oyun
+oynanabilir. GameSession aynı kuralları bitboard üzerinde bir nesnede toplar;
+bir işlem istediği kadar oturum barındırabilir (bkz. engine.server).
+
+Yapay zeka Player 1, insan Player 2'dir ve oyuna Player 1 başlar. İnsan
+hamleleri tek tek yapılır: taş sayısı ikiden fazlaysa bir turda iki farklı
+taş oynanır; ikinci hamle kalmazsa ya da rakibin taşı biterse tur erken
+biter, hiç hamlesi olmayan oyuncu pas geçer.
+"""
+
+from engine import bitboard
+from engine.board import apply_turn
+from engine.rules import MAX_TURNS, PLAYER_1, PLAYER_2
+
+AI_PLAYER = 1
+HUMAN_PLAYER = 2
+
+
+class GameSession:
+    """Bir oyunun durumu: taşlar, sıra, kalan tur ve turda yapılan hamleler.
+
+    turns_left, Player 1'in kalan tur sayısıdır. search_time oturumun
+    yapay zeka aramalarında harcadığı toplam süredir (adil zamanlama ve
+    bütçe için).
+    """
+
+    def __init__(self, session_id=0, state=None, max_turns=MAX_TURNS):
+        if state is None:
+            state = bitboard.from_positions(PLAYER_1["positions"], PLAYER_2["positions"])
+        self.session_id = session_id
+        self.state = state
+        self.player = AI_PLAYER
+        self.turns_left = max_turns
+        self.max_turns = max_turns
+        self.search_time = 0.0
+        self.last_ai_turn = ()
+        self._start_turn()
+
+    def _start_turn(self):
+        # Tur başında kalan hamle sayısı taş sayısına göre belirlenir
+        own = self.state.p1 if self.player == 1 else self.state.p2
+        self.moves_remaining = min(2, bitboard.popcount(own))
+        self.moved = 0  # Bu turda hamle yapan taşların bulunduğu kareler
+
+    def _end_turn(self):
+        if self.player == 1:
+            self.turns_left -= 1
+        self.player = 3 - self.player
+        self._start_turn()
+
+    def is_over(self):
+        """Taşı kalmayan oyuncu varsa ya da tur sınırı dolduysa True döndürür."""
+        return bitboard.is_terminal(self.state) or (self.player == 2 and self.turns_left == 0)
+
+    def winner(self):
+        """Bitmiş oyunun kazananı (1, 2 ya da 0 beraberlik); oyun sürüyorsa None."""
+        return bitboard.winner(self.state) if self.is_over() else None
+
+    def legal_moves(self):
+        """Sıradaki oyuncunun bu turda yapabileceği hamleler (kaynak, hedef kare)."""
+        if self.is_over() or not self.moves_remaining:
+            return []
+        return bitboard.generate_moves(self.state, self.player, self.moved)
+
+    def play_move(self, move):
+        """İnsan oyuncunun bir hamlesini uygular.
+
+        Geçersiz hamlede ValueError fırlatır. Tur bittiyse (ya da yapay
+        zekanın sırası geldiyse) True döndürür.
+        """
+        if self.player != HUMAN_PLAYER:
+            raise ValueError("Sıra yapay zekada")
+        move = tuple(move)
+        if move not in self.legal_moves():
+            raise ValueError(f"Geçersiz hamle: {move}")
+        self.state = bitboard.make_move(self.state, move, self.player)
+        self.moved |= 1 << move[1]
+        self.moves_remaining -= 1
+        if not self.moves_remaining or bitboard.is_terminal(self.state) or not self.legal_moves():
+            self._end_turn()
+            self.skip_passes()
+            return True
+        return False
+
+    def play_turn(self, turn):
+        """Yapay zekanın bütün turunu (hamle demeti; pas için ()) uygular."""
+        if self.player != AI_PLAYER:
+            raise ValueError("Sıra insan oyuncuda")
+        self.state = apply_turn(self.state, turn or (), self.player)
+        self.last_ai_turn = tuple(turn or ())
+        self._end_turn()
+        self.skip_passes()
+
+    def skip_passes(self):
+        """Sıradaki insan oyuncunun hiç hamlesi yoksa turunu pas geçer."""
+        while self.player == HUMAN_PLAYER and not self.is_over() and not self.legal_moves():
+            self._end_turn()
+
+    def to_dict(self):
+        """Oturumun JSON'a yazılabilir özeti (kareler (x, y) olarak)."""
+        return {
+            "session": self.session_id,
+            "p1": [list(pos) for pos in bitboard.positions_of(self.state.p1)],
+            "p2": [list(pos) for pos in bitboard.positions_of(self.state.p2)],
+            "player": self.player,
+            "moves_remaining": self.moves_remaining,
+            "turns_left": self.turns_left,
+            "over": self.is_over(),
+            "winner": self.winner(),
+            "moves": [[list(pos) for pos in bitboard.move_to_coords(move)] for move in self.legal_moves()]
+            if self.player == HUMAN_PLAYER else [],
+            "last_ai_turn": [[list(pos) for pos in bitboard.move_to_coords(move)] for move in self.last_ai_turn],
+        }
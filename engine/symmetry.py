@@ -0,0 +1,66 @@
+"""
+Tahta simetrileri ve konumların kanonik biçimi.
+
+7x7 tahtanın 8 simetrisinden (döndürme ve aynalama) oyun kurallarını
+koruyan yalnızca dikey aynalamadır (y -> 6 - y):
+- sol duvar bir ya da iki taşı, sağ duvar yalnızca tek taşı yer; yatay
+  aynalama ve 180 derece döndürme bu yüzden sonucu değiştirir,
+- satırlara yan duvar, sütunlara üst/alt duvar kuralı uygulanır; 90 derece
+  döndürme ve köşegen aynalamaları satırla sütunu değiştirir,
+- yemede Player 2'nin taşları Player 1'inkilerden önce kalkar; renkleri
+  değiştiren simetriler de kesin değildir.
+Başlangıç dizilimi 180 derece döndürmede kendine eşittir, ancak bu bir kural
+simetrisi olmadığından kullanılmaz.
+
+Bir konum ile dikey aynası aynı değere sahiptir (değerlendirme fonksiyonu
+da aynalamada değişmez). Kanonik biçim ikisinden Zobrist anahtarı küçük
+olanıdır; tablolar her konum çifti için tek kayıt tutar ve kayıtlı tur
+aynalanarak geri çevrilir.
+"""
+
+from engine.bitboard import GRID_SIZE, BitState
+from engine.transposition import zobrist_hash
+
+ROW_MASK = (1 << GRID_SIZE) - 1
+
+
+def flip_bits(bits):
+    """Bitboard'u dikey aynalar (satır sırasını ters çevirir)."""
+    flipped = 0
+    for y in range(GRID_SIZE):
+        flipped |= ((bits >> (y * GRID_SIZE)) & ROW_MASK) << ((GRID_SIZE - 1 - y) * GRID_SIZE)
+    return flipped
+
+
+def flip_square(sq):
+    """Kare numarasının dikey aynası."""
+    return (GRID_SIZE - 1 - sq // GRID_SIZE) * GRID_SIZE + sq % GRID_SIZE
+
+
+def flip_state(state):
+    """Konumun dikey aynası."""
+    return BitState(flip_bits(state.p1), flip_bits(state.p2))
+
+
+def flip_turn(turn):
+    """Turun (hamle demeti) dikey aynası; aynalama kendi tersidir."""
+    return tuple((flip_square(from_sq), flip_square(to_sq)) for from_sq, to_sq in turn)
+
+
+def canonical_key(state, player=1, turns_left=None):
+    """Konumun ve aynasının küçük Zobrist anahtarını döndürür.
+
+    (anahtar, aynalandı) döner; aynalandı True ise anahtar aynaya aittir ve
+    bu anahtarla saklanan turlar flip_turn() ile çevrilmelidir.
+    """
+    key = zobrist_hash(state, player, turns_left)
+    mirror_key = zobrist_hash(flip_state(state), player, turns_left)
+    if mirror_key < key:
+        return mirror_key, True
+    return key, False
+
+
+def canonical(state, player=1):
+    """Konumun kanonik biçimini döndürür: (konum, aynalandı)."""
+    _, flipped = canonical_key(state, player)
+    return (flip_state(state) if flipped else state), flipped
@@ -0,0 +1,305 @@
+"""
+Az taşlı oyun sonları için geriye doğru (retrograde) çözülmüş tablolar.
+
+Toplam taş sayısı max_pieces'ı geçmeyen her konum (sıradaki oyuncu dahil)
+kesin olarak çözülür: sıradaki oyuncu N yarım turda kazanır, N yarım turda
+kaybeder ya da oyun berabere kalır (hiçbir taraf rakibini bitiremez).
+Mesafeler tur sınırı olmayan oyuna göredir; arama bir sonucu yalnızca oyun
+tur sınırından önce bitiyorsa kullanır.
+
+Dosya biçimi (küçük endian):
+    başlık: sihirli sözcük (8 bayt), sürüm (uint32), max_pieces (uint32),
+            tablo sayısı (uint32)
+    dizin: her tablo için Player 1 taş sayısı, Player 2 taş sayısı, sıradaki
+           oyuncu (3 x uint8), dolgu, veri başlangıcı (uint64), konum sayısı
+           (uint64)
+    veri: konum başına bir int8: N > 0 N yarım turda kazanç, N < 0 -N yarım
+          turda kayıp, 0 beraberlik, UNKNOWN (-128) çözülemedi
+
+Bir tablodaki konum sırası: Player 1 karelerinin kombinasyon sırası (colex)
+ve Player 2 karelerinin boş kareler arasındaki kombinasyon sırası.
+
+Çözüm sırasında konum ile dikey aynası (engine.symmetry) tek düğümdür;
+dosyada ise okuma aynalama gerektirmesin diye her iki konum da yazılır.
+
+Oluşturmak için: python -m engine.tablebase --pieces 3 --output assets/tablebase.bin
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from array import array
+from itertools import combinations
+
+from engine import bitboard
+from engine.bitboard import NUM_SQUARES, BitState, popcount
+from engine.board import SearchBoard
+from engine.symmetry import flip_bits
+
+MAGIC = b"TAHTATB\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sIII")
+ENTRY = struct.Struct("<BBBxQQ")
+UNKNOWN = -128
+MAX_DISTANCE = 127
+DEFAULT_PIECES = 3
+
+_BINOMIAL = [[0] * (NUM_SQUARES + 1) for _ in range(NUM_SQUARES + 1)]
+for _n in range(NUM_SQUARES + 1):
+    _BINOMIAL[_n][0] = 1
+    for _k in range(1, _n + 1):
+        _BINOMIAL[_n][_k] = _BINOMIAL[_n - 1][_k - 1] + _BINOMIAL[_n - 1][_k]
+
+
+def table_size(n1, n2):
+    """(n1, n2) taşlı tablonun konum sayısı."""
+    return _BINOMIAL[NUM_SQUARES][n1] * _BINOMIAL[NUM_SQUARES - n1][n2]
+
+
+def position_index(p1, p2):
+    """Konumun kendi (taş sayısı) tablosundaki sırası."""
+    rank1 = 0
+    i = 0
+    bits = p1
+    while bits:
+        low = bits & -bits
+        bits ^= low
+        i += 1
+        rank1 += _BINOMIAL[low.bit_length() - 1][i]
+    # Player 2 kareleri Player 1'in boş bıraktığı kareler arasında numaralanır
+    rank2 = 0
+    i = 0
+    bits = p2
+    while bits:
+        low = bits & -bits
+        bits ^= low
+        i += 1
+        sq = low.bit_length() - 1
+        rank2 += _BINOMIAL[sq - popcount(p1 & (low - 1))][i]
+    return rank1 * _BINOMIAL[NUM_SQUARES - popcount(p1)][popcount(p2)] + rank2
+
+
+def _tables(max_pieces):
+    return [
+        (n1, n2, player)
+        for n1 in range(1, max_pieces)
+        for n2 in range(1, max_pieces - n1 + 1)
+        for player in (1, 2)
+    ]
+
+
+def generate(max_pieces=DEFAULT_PIECES, progress=None):
+    """Tabloları çözer; {(n1, n2, oyuncu): array('b')} döndürür.
+
+    Önce her konumun turlarından sonraki konumlar bulunur (rakibini bitiren
+    tur kazançtır). Sonra sonuçlar kazanç/kayıp konumlarından geriye doğru
+    yayılır: kaybeden bir konuma giden konum kazanır; bütün turları kazanan
+    konumlara giden konum kaybeder. Çözülemeyen konumlar beraberedir.
+    Ayna konumlar çözülmez; değerleri aynalarından kopyalanır.
+    progress verilirse her tablodan sonra (aşama, tablo) ile çağrılır.
+    """
+    tables = _tables(max_pieces)
+    offsets = {}
+    total = 0
+    for n1, n2, player in tables:
+        offsets[n1, n2, player] = total
+        total += table_size(n1, n2)
+
+    def global_index(p1, p2, player):
+        return offsets[popcount(p1), popcount(p2), player] + position_index(p1, p2)
+
+    def canonical_index(p1, p2, player):
+        # Konum ve dikey aynasından küçük indeksli olan çözülür
+        offset = offsets[popcount(p1), popcount(p2), player]
+        return offset + min(position_index(p1, p2), position_index(flip_bits(p1), flip_bits(p2)))
+
+    WIN, LOSS = 1, 2
+    result = bytearray(total)
+    distance = bytearray(total)
+    remaining = array("i", bytes(4 * total))
+    parents = [None] * total
+    mirror_of = {}
+    queue = []
+
+    for table in tables:
+        n1, n2, player = table
+        for squares1 in combinations(range(NUM_SQUARES), n1):
+            p1 = sum(1 << sq for sq in squares1)
+            free = [sq for sq in range(NUM_SQUARES) if not p1 >> sq & 1]
+            for squares2 in combinations(free, n2):
+                p2 = sum(1 << sq for sq in squares2)
+                index = global_index(p1, p2, player)
+                mirror = global_index(flip_bits(p1), flip_bits(p2), player)
+                if mirror < index:
+                    mirror_of[index] = mirror
+                    continue
+                board = SearchBoard(BitState(p1, p2), player)
+                children = set()
+                wins = False
+                draw_exit = False
+                turns = board.turns()
+                for _ in turns:
+                    if board.p1 and board.p2:
+                        children.add(canonical_index(board.p1, board.p2, board.player))
+                        continue
+                    winner = bitboard.winner(board)
+                    if winner == player:
+                        wins = True
+                        turns.close()
+                        break
+                    if winner == 0:
+                        draw_exit = True
+                if wins:
+                    result[index] = WIN
+                    distance[index] = 1
+                    queue.append(index)
+                elif not children and not draw_exit:
+                    # Her tur kendi taşlarını bitiriyor
+                    result[index] = LOSS
+                    distance[index] = 1
+                    queue.append(index)
+                else:
+                    remaining[index] = len(children) + draw_exit
+                    for child in children:
+                        if parents[child] is None:
+                            parents[child] = [index]
+                        else:
+                            parents[child].append(index)
+        if progress is not None:
+            progress("turlar", table)
+
+    truncated = False
+    head = 0
+    while head < len(queue):
+        index = queue[head]
+        head += 1
+        if parents[index] is None:
+            continue
+        d = distance[index] + 1
+        if d > MAX_DISTANCE:
+            truncated = True
+            continue
+        if result[index] == LOSS:
+            for parent in parents[index]:
+                if not result[parent]:
+                    result[parent] = WIN
+                    distance[parent] = d
+                    queue.append(parent)
+        else:
+            for parent in parents[index]:
+                if not result[parent]:
+                    remaining[parent] -= 1
+                    if not remaining[parent]:
+                        result[parent] = LOSS
+                        distance[parent] = d
+                        queue.append(parent)
+    if progress is not None:
+        progress("geri yayılım", None)
+
+    values = {}
+    for table in tables:
+        offset = offsets[table]
+        data = array("b", bytes(table_size(*table[:2])))
+        for i in range(len(data)):
+            index = mirror_of.get(offset + i, offset + i)
+            outcome = result[index]
+            if outcome == WIN:
+                data[i] = distance[index]
+            elif outcome == LOSS:
+                data[i] = -distance[index]
+            elif truncated:
+                data[i] = UNKNOWN
+        values[table] = data
+    return values
+
+
+def write_tablebase(path, max_pieces, values):
+    """generate() sonucunu dosyaya yazar."""
+    tables = _tables(max_pieces)
+    offset = HEADER.size + ENTRY.size * len(tables)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, max_pieces, len(tables)))
+        for n1, n2, player in tables:
+            count = len(values[n1, n2, player])
+            f.write(ENTRY.pack(n1, n2, player, offset, count))
+            offset += count
+        for table in tables:
+            f.write(values[table].tobytes())
+
+
+class Tablebase:
+    """mmap ile açılmış salt okunur oyun sonu tablosu."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.max_pieces, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Geçersiz oyun sonu tablosu: {path}")
+        self._offsets = {}
+        for i in range(count):
+            n1, n2, player, offset, size = ENTRY.unpack_from(self._mm, HEADER.size + i * ENTRY.size)
+            if offset + size > len(self._mm):
+                self.close()
+                raise ValueError(f"Oyun sonu tablosu eksik: {path}")
+            self._offsets[n1, n2, player] = offset
+
+    def probe(self, state, player):
+        """Sıradaki oyuncu açısından tablo değerini döndürür.
+
+        N > 0: N yarım turda kazanç, N < 0: -N yarım turda kayıp, 0:
+        beraberlik, UNKNOWN: çözülemedi. Konum tabloda yoksa (taş fazla ya da
+        oyun bitmiş) None.
+        """
+        offset = self._offsets.get((popcount(state.p1), popcount(state.p2), player))
+        if offset is None:
+            return None
+        return struct.unpack_from("b", self._mm, offset + position_index(state.p1, state.p2))[0]
+
+    def close(self):
+        """Dosya eşlemesini kapatır."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_in_worker(path):
+    """İşçi işlemin başlangıcında tabloyu yolundan açar; path None ise None.
+
+    mmap işlemler arasında aktarılamaz; işlem havuzları tabloyu nesne
+    olarak değil Tablebase.path ile verir ve her işçi kendi eşlemesini açar.
+    """
+    return Tablebase(path) if path is not None else None
+
+
+def main(argv=None):
+    """Oyun sonu tablolarını çözer ve dosyaya yazar."""
+    parser = argparse.ArgumentParser(description="Oyun sonu tablosu oluşturucu")
+    parser.add_argument("--pieces", type=int, default=DEFAULT_PIECES, help="en çok toplam taş sayısı")
+    parser.add_argument("--output", default="tablebase.bin", help="tablo dosyası")
+    args = parser.parse_args(argv)
+
+    start = time.monotonic()
+
+    def progress(stage, table):
+        print(f"{time.monotonic() - start:>7.1f} s  {stage}" + (f" {table}" if table else ""))
+
+    values = generate(args.pieces, progress)
+    write_tablebase(args.output, args.pieces, values)
+    wins = sum(1 for data in values.values() for v in data if 0 < v)
+    losses = sum(1 for data in values.values() for v in data if UNKNOWN < v < 0)
+    total = sum(len(data) for data in values.values())
+    print(f"{total} konum ({wins} kazanç, {losses} kayıp) {args.output} dosyasına yazıldı")
+
+
+if __name__ == "__main__":
+    main()
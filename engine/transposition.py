@@ -0,0 +1,108 @@
+"""
+Zobrist hash ve transpozisyon tablosu.
+
+Aynı konuma farklı hamle sıralarıyla ulaşıldığında arama sonucu tablodan
+okunur. Tablo sabit boyutludur; her yuvada tek kayıt tutulur.
+"""
+
+import random
+
+from engine.bitboard import NUM_SQUARES
+
+# Sabit tohum: hash değerleri çalıştırmalar arasında aynı kalır
+_rng = random.Random(0x5EED_7A7E)
+ZOBRIST_P1 = [_rng.getrandbits(64) for _ in range(NUM_SQUARES)]
+ZOBRIST_P2 = [_rng.getrandbits(64) for _ in range(NUM_SQUARES)]
+ZOBRIST_P2_TO_MOVE = _rng.getrandbits(64)
+# Kalan tur sayısı: tur sınırına yakın konumların değeri kalan tura bağlıdır
+MAX_TURNS_LEFT = 256
+ZOBRIST_TURNS = [_rng.getrandbits(64) for _ in range(MAX_TURNS_LEFT)]
+
+# Sınır türleri
+EXACT = 0
+LOWER = 1  # Gerçek değer >= score (beta kesmesi)
+UPPER = 2  # Gerçek değer <= score (hiçbir hamle alpha'yı geçemedi)
+
+
+def zobrist_hash(state, player, turns_left=None):
+    """Durumun ve sıradaki oyuncunun (1 veya 2) 64 bitlik hash değeri.
+
+    turns_left verilirse (Player 1'in kalan tur sayısı) hash'e katılır.
+    """
+    key = ZOBRIST_P2_TO_MOVE if player == 2 else 0
+    if turns_left is not None:
+        key ^= ZOBRIST_TURNS[turns_left]
+    bits = state.p1
+    while bits:
+        low = bits & -bits
+        key ^= ZOBRIST_P1[low.bit_length() - 1]
+        bits ^= low
+    bits = state.p2
+    while bits:
+        low = bits & -bits
+        key ^= ZOBRIST_P2[low.bit_length() - 1]
+        bits ^= low
+    return key
+
+
+class TranspositionTable:
+    """Sınırlı boyutlu transpozisyon tablosu.
+
+    Kayıtlar (key, depth, score, flag, best_move, age) demetleridir. Bir yuva
+    doluysa yeni kayıt; aynı konumsa, eski bir aramadan kalmışsa ya da en az
+    onun kadar derin aranmışsa yazılır (derinlik öncelikli değiştirme).
+    """
+
+    def __init__(self, size_bits=18):
+        self.size = 1 << size_bits
+        self.mask = self.size - 1
+        self.clear()
+
+    def clear(self):
+        """Tabloyu ve sayaçları sıfırlar."""
+        self.entries = [None] * self.size
+        self.age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_search(self):
+        """Yeni bir kök aramanın başladığını bildirir; eski kayıtlar öncelik kaybeder."""
+        self.age += 1
+
+    def probe(self, key):
+        """Konumun kaydını döndürür, yoksa None."""
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, score, flag, best_move):
+        """Arama sonucunu değiştirme politikasına göre tabloya yazar."""
+        index = key & self.mask
+        old = self.entries[index]
+        if old is not None:
+            if old[0] != key and old[5] == self.age and old[1] > depth:
+                return
+            if old[0] != key:
+                self.overwrites += 1
+        self.entries[index] = (key, depth, score, flag, best_move, self.age)
+        self.stores += 1
+
+    def hit_rate(self):
+        """Sorguların isabet oranı (0-1)."""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def stats(self):
+        """Sayaçları sözlük olarak döndürür."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "hit_rate": self.hit_rate(),
+        }
@@ -0,0 +1,93 @@
+"""
+SearchBoard'un artımlı değerlerinin (score, key, mirror_key) rastgele
+push/pop dizilerinde baştan hesaplananlarla karşılaştırılması.
+"""
+
+import random
+
+from engine import bitboard, rules
+from engine.board import SearchBoard, apply_turn, generate_turns
+from engine.symmetry import flip_state
+from engine.transposition import zobrist_hash
+
+
+def _snapshot(board):
+    return board.p1, board.p2, board.player, board.turns_left, board.score, board.key, board.mirror_key
+
+
+def _check(board):
+    state = board.state()
+    player_1, player_2 = bitboard.to_positions(state)
+    assert board.score == bitboard.evaluate(state)
+    assert board.score == rules.evaluate_state({"player_1": player_1, "player_2": player_2})
+    assert board.key == zobrist_hash(state, board.player, board.turns_left)
+    assert board.mirror_key == zobrist_hash(flip_state(state), board.player, board.turns_left)
+
+
+def _random_state(rng):
+    cells = rng.sample(range(bitboard.NUM_SQUARES), rng.randint(2, 16))
+    split = rng.randint(1, len(cells) - 1)
+    state = bitboard.BitState(sum(1 << sq for sq in cells[:split]), sum(1 << sq for sq in cells[split:]))
+    return bitboard.resolve_captures(state)
+
+
+def test_push_pop_keeps_incremental_values_exact():
+    rng = random.Random(9)
+    pushes = 0
+    for _ in range(300):
+        state = _random_state(rng)
+        board = SearchBoard(state, rng.choice((1, 2)), rng.choice((None, 3, 10)))
+        _check(board)
+        history = []
+        for _ in range(rng.randint(1, 40)):
+            if board.is_game_over() or (history and rng.random() < 0.3):
+                if not history:
+                    break
+                board.pop()
+                assert _snapshot(board) == history.pop()
+                _check(board)
+                continue
+            history.append(_snapshot(board))
+            moves = board.generate_moves()
+            if not moves:
+                board.push_pass()
+            else:
+                board.push(rng.choice(moves), end_turn=rng.random() < 0.5)
+            pushes += 1
+            _check(board)
+        while history:
+            board.pop()
+            assert _snapshot(board) == history.pop()
+        assert board.state() == state
+    assert pushes > 1000
+
+
+def test_turns_restore_the_board():
+    rng = random.Random(10)
+    for _ in range(100):
+        state = _random_state(rng)
+        player = rng.choice((1, 2))
+        board = SearchBoard(state, player, rng.choice((None, 1, 5)))
+        before = _snapshot(board)
+        for turn in board.turns():
+            _check(board)
+            assert board.state() == apply_turn(state, turn, player)
+        assert _snapshot(board) == before
+
+
+def test_capture_turns_are_legal_turns():
+    rng = random.Random(22)
+    checked = 0
+    for _ in range(300):
+        state = _random_state(rng)
+        player = rng.choice((1, 2))
+        board = SearchBoard(state, player)
+        legal = {apply_turn(state, turn, player) for turn in generate_turns(state, player)}
+        before = _snapshot(board)
+        for turn in board.capture_turns():
+            _check(board)
+            assert board.state() == apply_turn(state, turn, player)
+            assert board.state() in legal
+            checked += 1
+        assert _snapshot(board) == before
+    assert checked > 100
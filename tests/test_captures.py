@@ -0,0 +1,162 @@
+"""
+Taş yeme kurallarının tablo tabanlı uygulaması (bitboard.capture_at,
+bitboard.resolve_captures, rules.apply_captures) ile eski liste tabanlı
+kuralların rastgele tahtalarda karşılaştırılması.
+
+Referans, oyunun ilk sürümündeki check_for_eliminations() ve
+check_wall_captures() fonksiyonlarının konum listeleri üzerinde çalışan
+kopyasıdır; tarama sırası ve yeme sırası (önce sandviçler, sonra sol, sağ,
+üst ve alt duvar) aynen korunmuştur.
+"""
+
+import random
+
+from engine import bitboard, rules
+from engine.bitboard import GRID_SIZE
+
+LAST = GRID_SIZE - 1
+
+
+def _sandwich(own, other, cell):
+    # own taşları arasında kalan other taşlarını siler; cell(i, j) satır ya da sütun karesidir
+    for j in range(GRID_SIZE):
+        i = 0
+        while i < LAST:
+            if cell(i, j) in own:
+                end = i + 1
+                while end < GRID_SIZE and cell(end, j) in other:
+                    end += 1
+                if end < GRID_SIZE and cell(end, j) in own:
+                    for k in range(i + 1, end):
+                        other.remove(cell(k, j))
+                i = end
+            else:
+                i += 1
+
+
+def _near_wall(p1, p2, cell):
+    # Sol ve üst duvar: duvar - taş - rakip ya da duvar - taş - taş - rakip
+    for j in range(GRID_SIZE):
+        if cell(0, j) in p1 and cell(1, j) in p2:
+            p1.remove(cell(0, j))
+        elif cell(0, j) in p2 and cell(1, j) in p1:
+            p2.remove(cell(0, j))
+        elif cell(0, j) in p1 and cell(1, j) in p1 and cell(2, j) in p2:
+            p1.remove(cell(0, j))
+            p1.remove(cell(1, j))
+        elif cell(0, j) in p2 and cell(1, j) in p2 and cell(2, j) in p1:
+            p2.remove(cell(0, j))
+            p2.remove(cell(1, j))
+
+
+def _far_wall_bottom(p1, p2):
+    for x in range(GRID_SIZE):
+        if (x, LAST) in p2 and (x, LAST - 1) in p1:
+            p2.remove((x, LAST))
+        elif (x, LAST) in p1 and (x, LAST - 1) in p2:
+            p1.remove((x, LAST))
+        elif (x, LAST) in p2 and (x, LAST - 1) in p2 and (x, LAST - 2) in p1:
+            p2.remove((x, LAST))
+            p2.remove((x, LAST - 1))
+        elif (x, LAST) in p1 and (x, LAST - 1) in p1 and (x, LAST - 2) in p2:
+            p1.remove((x, LAST))
+            p1.remove((x, LAST - 1))
+
+
+def _far_wall_right(p1, p2):
+    # Eski kuralın üçüncü ve dördüncü dalı duvardaki taşı değil, yanındaki
+    # iki taşı siler; bu dallar ilk iki dal yüzünden hiç çalışmaz
+    for y in range(GRID_SIZE):
+        if (LAST, y) in p2 and (LAST - 1, y) in p1:
+            p2.remove((LAST, y))
+        elif (LAST, y) in p1 and (LAST - 1, y) in p2:
+            p1.remove((LAST, y))
+        elif (LAST, y) in p2 and (LAST - 1, y) in p1 and (LAST - 2, y) in p1:
+            p1.remove((LAST - 1, y))
+            p1.remove((LAST - 2, y))
+        elif (LAST, y) in p1 and (LAST - 1, y) in p2 and (LAST - 2, y) in p2:
+            p2.remove((LAST - 1, y))
+            p2.remove((LAST - 2, y))
+
+
+def reference_captures(p1, p2):
+    """Eski liste kurallarını p1 ve p2 konum listelerine (yerinde) uygular."""
+    _sandwich(p1, p2, lambda i, j: (i, j))
+    _sandwich(p2, p1, lambda i, j: (i, j))
+    _sandwich(p1, p2, lambda i, j: (j, i))
+    _sandwich(p2, p1, lambda i, j: (j, i))
+    _near_wall(p1, p2, lambda i, j: (i, j))
+    _far_wall_right(p1, p2)
+    _near_wall(p1, p2, lambda i, j: (j, i))
+    _far_wall_bottom(p1, p2)
+
+
+def _random_positions(rng, max_pieces=30):
+    cells = rng.sample([(x, y) for y in range(GRID_SIZE) for x in range(GRID_SIZE)], rng.randint(2, max_pieces))
+    split = rng.randint(1, len(cells) - 1)
+    return cells[:split], cells[split:]
+
+
+def _settled_positions(rng):
+    # Bekleyen yemesi olmayan (referansa göre kararlı) bir tahta
+    p1, p2 = _random_positions(rng)
+    while True:
+        before = (len(p1), len(p2))
+        reference_captures(p1, p2)
+        if (len(p1), len(p2)) == before:
+            return p1, p2
+
+
+def test_resolve_captures_matches_reference():
+    rng = random.Random(1)
+    for _ in range(2000):
+        p1, p2 = _random_positions(rng)
+        state = bitboard.from_positions(p1, p2)
+        reference_captures(p1, p2)
+        assert bitboard.resolve_captures(state) == bitboard.from_positions(p1, p2)
+
+
+def test_capture_at_matches_reference_after_a_move():
+    rng = random.Random(2)
+    checked = 0
+    for _ in range(8000):
+        p1, p2 = _settled_positions(rng)
+        state = bitboard.from_positions(p1, p2)
+        player = rng.choice((1, 2))
+        moves = bitboard.generate_moves(state, player)
+        if not moves:
+            continue
+        move = rng.choice(moves)
+        (from_pos, to_pos) = bitboard.move_to_coords(move)
+        own = p1 if player == 1 else p2
+        own[own.index(from_pos)] = to_pos
+        reference_captures(p1, p2)
+        expected = bitboard.from_positions(p1, p2)
+
+        moved = bitboard.apply_move(state, move, player)
+        assert bitboard.capture_at(moved.p1, moved.p2, move[1]) == tuple(expected)
+        assert bitboard.make_move(state, move, player) == expected
+        assert bitboard.resolve_captures(moved) == expected
+        checked += 1
+    assert checked > 4000
+
+
+def test_apply_captures_matches_reference():
+    rng = random.Random(3)
+    for _ in range(2000):
+        p1, p2 = _settled_positions(rng)
+        state = bitboard.from_positions(p1, p2)
+        moves = bitboard.generate_moves(state, 1)
+        if not moves:
+            continue
+        from_pos, to_pos = bitboard.move_to_coords(rng.choice(moves))
+        p1[p1.index(from_pos)] = to_pos
+        player_1 = {"positions": list(p1)}
+        player_2 = {"positions": list(p2)}
+        captured = rules.apply_captures(to_pos, player_1, player_2)
+        before = set(p1) | set(p2)
+        reference_captures(p1, p2)
+        # Kalan taşların sırası korunur
+        assert player_1["positions"] == p1
+        assert player_2["positions"] == p2
+        assert sorted(captured) == sorted(before - set(p1) - set(p2))
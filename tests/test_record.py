@@ -0,0 +1,50 @@
+"""
+Yarıda kesilmiş oyun kaydı dosyasına yeni oyunların eklenmesi.
+"""
+
+import os
+
+import pytest
+
+from engine import bitboard
+from engine.book import INITIAL_STATE
+from engine.board import generate_turns
+from engine.record import HEADER, GameWriter, read_games
+
+
+def _turns(count):
+    state, player, turns = INITIAL_STATE, 1, []
+    for _ in range(count):
+        turn = generate_turns(state, player)[0]
+        for move in turn:
+            state = bitboard.make_move(state, move, player)
+        turns.append(turn)
+        player = 3 - player
+    return turns
+
+
+def test_writer_truncates_a_partial_record(tmp_path):
+    path = str(tmp_path / "games.rec")
+    turns = _turns(3)
+    with GameWriter(path) as writer:
+        writer.write_game(INITIAL_STATE, turns, 1)
+        writer.start_game(INITIAL_STATE)
+        writer.move(1, turns[0][0])
+    # Son MOVE kaydının ortasında kesilmiş yazıcı
+    size = os.path.getsize(path)
+    with open(path, "r+b") as f:
+        f.truncate(size - 5)
+
+    with GameWriter(path) as writer:
+        writer.write_game(INITIAL_STATE, turns[:2], 2)
+    games = list(read_games(path))
+    assert [game.winner for game in games] == [1, None, 2]
+    assert [len(game.turns) for game in games] == [3, 0, 2]
+    assert [tuple(move for move, _ in turn) for turn in games[2].turns] == turns[:2]
+
+
+def test_writer_rejects_a_short_header(tmp_path):
+    path = tmp_path / "games.rec"
+    path.write_bytes(b"\x00" * (HEADER.size - 1))
+    with pytest.raises(ValueError):
+        GameWriter(str(path))
@@ -0,0 +1,117 @@
+"""
+GameServer'ın boş bir portta gerçek soket istemcileriyle denenmesi: iç içe
+oynanan iki oyun, hatalı istekler ve başka bağlantının oturumlarına erişim.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from engine.server import Client, GameServer, SearchScheduler
+
+
+async def _raw(client, line):
+    # Client.request JSON üretir; bozuk satırlar doğrudan yazılır
+    client.writer.write(line + b"\n")
+    await client.writer.drain()
+    return json.loads(await client.reader.readline())
+
+
+async def _play(client, state, move_index=0):
+    move = state["moves"][move_index % len(state["moves"])]
+    return (await client.request(cmd="move", session=state["session"], move=move))["state"]
+
+
+async def _scenario():
+    scheduler = SearchScheduler(workers=1, turn_time=0.05, session_budget=1.0, max_depth=1)
+    game_server = GameServer(scheduler)
+    server = await asyncio.start_server(game_server.handle_client, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with server:
+            client = await Client.connect("127.0.0.1", port)
+            other = await Client.connect("127.0.0.1", port)
+
+            first = (await client.request(cmd="new", max_turns=4))["state"]
+            second = (await client.request(cmd="new", max_turns=4))["state"]
+            assert first["session"] != second["session"]
+            assert not first["over"] and not second["over"]
+
+            # Hatalı istekler bağlantıyı ve oturumları bozmaz
+            malformed = [
+                b"not json",
+                b"[1, 2]",
+                json.dumps({"cmd": "state", "session": [1]}).encode(),
+                json.dumps({"cmd": "state", "session": True}).encode(),
+                json.dumps({"cmd": "new", "max_turns": None}).encode(),
+                json.dumps({"cmd": "new", "max_turns": "5"}).encode(),
+                json.dumps({"cmd": "move", "session": first["session"], "move": "a1"}).encode(),
+                json.dumps({"cmd": "move", "session": first["session"]}).encode(),
+                json.dumps({"cmd": "move", "session": first["session"], "move": [[9, 9], [9, 8]]}).encode(),
+                json.dumps({"cmd": "dance"}).encode(),
+            ]
+            for line in malformed:
+                response = await _raw(client, line)
+                assert response["ok"] is False and response["error"]
+
+            # Başka bağlantı bu oturumları göremez, oynayamaz ve kapatamaz
+            for request in ({"cmd": "state"}, {"cmd": "close"},
+                            {"cmd": "move", "move": first["moves"][0]}):
+                with pytest.raises(ValueError):
+                    await other.request(session=first["session"], **request)
+            assert (await client.request(cmd="state", session=first["session"]))["state"] == first
+
+            # İki oyun iç içe sonuna kadar oynanır
+            moves = 0
+            while not (first["over"] and second["over"]):
+                if not first["over"]:
+                    first = await _play(client, first, moves)
+                if not second["over"]:
+                    second = await _play(client, second, moves + 1)
+                moves += 1
+                assert (await client.request(cmd="state", session=second["session"]))["state"] == second
+            assert first["winner"] is not None and second["winner"] is not None
+
+            await client.request(cmd="close", session=first["session"])
+            with pytest.raises(ValueError):
+                await client.request(cmd="state", session=first["session"])
+            assert (await client.request(cmd="state", session=second["session"]))["state"] == second
+
+            stats = (await other.request(cmd="stats"))["stats"]
+            assert stats["sessions"] == 1
+            assert stats["games_finished"] == 2
+            assert stats["searches"] > 0
+
+            await client.close()
+            await other.close()
+            await game_server.wait_connections()
+            # Bağlantı kapanınca açtığı oturumlar silinir
+            assert game_server.sessions == {}
+    finally:
+        scheduler.close()
+
+
+def test_server_sessions_survive_bad_requests():
+    asyncio.run(asyncio.wait_for(_scenario(), 120))
+
+
+async def _cancelled_job():
+    scheduler = SearchScheduler(workers=1)
+    try:
+        loop = asyncio.get_running_loop()
+        job, future, queued = loop.create_future(), loop.create_future(), loop.create_future()
+        job.cancel()
+        queued.cancel()
+        scheduler.running = 1
+        scheduler._waiting.append((0.0, 0, None, queued))
+        scheduler._finished(None, future, job)
+        assert future.cancelled()
+        assert scheduler.running == 0
+        assert scheduler.waiting == 0  # Sıradaki aramalar yine dağıtılır
+    finally:
+        scheduler.close()
+
+
+def test_cancelled_search_job_releases_its_request():
+    asyncio.run(_cancelled_job())